@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('database_config.py', '.')]
 binaries = []
-hiddenimports = ['tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox', 'tkinter.scrolledtext', 'json', 'logging', 'threading', 'datetime', 'glob', 'os', 'sys', 'subprocess', 'platform', 'json_parser', 'field_loader', 'field_comparator', 'document_parser', 'chardet']
+hiddenimports = ['tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox', 'tkinter.scrolledtext', 'json', 'logging', 'threading', 'datetime', 'glob', 'os', 'sys', 'subprocess', 'platform', 'json_parser', 'field_loader', 'field_comparator', 'document_parser', 'chardet', 'orjson', 'ijson']
 tmp_ret = collect_all('docx')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
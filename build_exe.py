@@ -80,6 +80,8 @@ args = [
     '--hidden-import=field_comparator',
     '--hidden-import=document_parser',
     '--hidden-import=chardet',  # Optional dependency for encoding detection
+    '--hidden-import=orjson',  # Optional dependency for faster JSON parsing
+    '--hidden-import=ijson',  # Optional dependency for streaming large JSON arrays
     
     # Collect all dependencies for docx (if used)
     '--collect-all=docx',
@@ -13,6 +13,14 @@ from difflib import SequenceMatcher
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Characters outside the allowed set for field values (letters, numbers, spaces, underscores,
+# hyphens, dots, parentheses, commas, colons, semicolons, quotes)
+_VALUE_SPECIAL_CHAR_RE = re.compile(r'[^a-zA-Z0-9\s_\-\.\(\)\,\:\;\"\']')
+# Field names made only of allowed characters (letters, numbers, spaces, underscores, hyphens, dots, parentheses)
+_FIELD_NAME_ALLOWED_RE = re.compile(r'^[a-zA-Z0-9\s_\-\.\(\)]+$')
+# Characters outside the allowed set for field names
+_FIELD_NAME_SPECIAL_CHAR_RE = re.compile(r'[^a-zA-Z0-9\s_\-\.\(\)]')
+
 
 class FieldComparator:
     def __init__(self, case_sensitive: bool = False, fuzzy_match: bool = True, 
@@ -390,17 +398,8 @@ class FieldComparator:
         """
         # Allowed characters: letters, numbers, spaces, common punctuation, and basic symbols
         # We're more lenient with values than field names
-        # Allow: letters, numbers, spaces, underscores, hyphens, dots, parentheses, commas, colons, semicolons, quotes
-        allowed_pattern = re.compile(r'[a-zA-Z0-9\s_\-\.\(\)\,\:\;\"\']')
-        
-        # Find all characters that are NOT in the allowed set
-        special_chars = []
-        for char in value:
-            if not allowed_pattern.match(char):
-                if char not in special_chars:
-                    special_chars.append(char)
-        
-        return special_chars
+        # Find all characters that are NOT in the allowed set (unique, in order of first appearance)
+        return list(dict.fromkeys(_VALUE_SPECIAL_CHAR_RE.findall(value)))
     
     def _find_line_number(self, file_content_lines: Optional[List[str]], field_path: str, value: str) -> Optional[int]:
         """
@@ -462,10 +461,8 @@ class FieldComparator:
         """
         # Allowed characters: letters, numbers, spaces, underscores, hyphens, dots, parentheses
         # Special characters are anything else
-        allowed_pattern = re.compile(r'^[a-zA-Z0-9\s_\-\.\(\)]+$')
-        
         # Check if field contains any characters outside the allowed set
-        if not allowed_pattern.match(field_name):
+        if not _FIELD_NAME_ALLOWED_RE.match(field_name):
             return True
         
         return False
@@ -481,16 +478,8 @@ class FieldComparator:
             List of special characters found in the field name
         """
         # Allowed characters: letters, numbers, spaces, underscores, hyphens, dots, parentheses
-        allowed_pattern = re.compile(r'[a-zA-Z0-9\s_\-\.\(\)]')
-        
-        # Find all characters that are NOT in the allowed set
-        special_chars = []
-        for char in field_name:
-            if not allowed_pattern.match(char):
-                if char not in special_chars:
-                    special_chars.append(char)
-        
-        return special_chars
+        # Find all characters that are NOT in the allowed set (unique, in order of first appearance)
+        return list(dict.fromkeys(_FIELD_NAME_SPECIAL_CHAR_RE.findall(field_name)))
     
     def _is_excluded_field(self, field_name: str) -> bool:
         """
@@ -10,11 +10,13 @@ import os
 import sys
 import glob
 import logging
+import multiprocessing
 import threading
 import subprocess
 import platform
 from typing import Dict, List, Set, Tuple
 from datetime import datetime
+from itertools import islice
 
 # Setup logging with file handler
 def setup_logging(database_name: str = ""):
@@ -88,7 +90,7 @@ def setup_logging(database_name: str = ""):
                 unique_db_fields = sorted(self.db_fields.keys())
                 final_file.write(f"Annexure Fields ({len(unique_db_fields)}):\n")
                 for field in unique_db_fields:
-                    chars_list = sorted(list(self.db_fields[field]))
+                    chars_list = sorted(self.db_fields[field])
                     chars_str = ', '.join([f"'{c}'" for c in chars_list])
                     final_file.write(f"  - {field}: special characters [{chars_str}]\n")
             
@@ -97,7 +99,7 @@ def setup_logging(database_name: str = ""):
                 final_file.write(f"\nJSON Fields ({len(unique_json_fields)}):\n")
                 for field in unique_json_fields:
                     info = self.json_fields[field]
-                    chars_list = sorted(list(info['special_chars']))
+                    chars_list = sorted(info['special_chars'])
                     chars_str = ', '.join([f"'{c}'" for c in chars_list])
                     sample = info['sample_value']
                     
@@ -389,6 +391,13 @@ from json_parser import JSONParser
 from field_comparator import FieldComparator
 from json_validator import JSONValidator
 
+# Translation table that strips separators when normalizing category names
+_STRIP_SEPS = str.maketrans('', '', ' _-')
+# Translation table that strips separators when normalizing field and array names (same set as FieldComparator)
+_FIELD_NAME_SEPS = str.maketrans('', '', ' _-.')
+# Normalized form of the evolvus_id category
+_EVOLVUS_ID_NORM = 'evolvusid'
+
 
 class FieldMapperApp:
     def __init__(self, root):
@@ -414,6 +423,8 @@ class FieldMapperApp:
         self.loader_data = {}
         self.record_unmatched_info = {}  # Store per-record unmatched field info: {file_path: {record_idx: {unmatched_json: [], unmatched_db: []}}}
         self.fields_with_special_chars = {'db': [], 'json': []}  # Store fields with special characters
+        self.evolvus_field_names = set()  # Result field names containing 'evolvus' (filled when results are displayed)
+        self.result_rows = []  # Mirror of results tree rows as (field_name, values) so lookups avoid Tk round-trips
         self.current_log_files = {}  # Store current log file paths (will be set when comparison starts)
         self.special_chars_writer = None  # Special chars log writer (will be set when comparison starts)
         self.field_matching_writer = None  # Field matching log writer (will be set when comparison starts)
@@ -1036,6 +1047,8 @@ Report saved to: {report_path}
             # Clear all previous results and logs before starting new comparison
             for item in self.results_tree.get_children():
                 self.results_tree.delete(item)
+            self.evolvus_field_names.clear()
+            self.result_rows.clear()
             
             self.summary_text.delete(1.0, tk.END)  # Clear summary
             self.record_unmatched_info = {}  # Clear per-record unmatched info
@@ -1153,25 +1166,14 @@ Report saved to: {report_path}
                                 processed += 1
                                 continue
                             
-                            # Extract fields from already-loaded data (avoid re-reading file)
+                            # Extract fields, null categories and array field mapping from already-loaded data in one pass
+                            extracted_fields, array_field_mapping, null_categories = self.json_parser.extract_field_metadata(json_data)
                             if json_file in self.json_fields:
                                 json_fields = self.json_fields[json_file]
                             else:
-                                json_fields = sorted(list(set(self.json_parser._extract_all_fields(json_data))))
+                                json_fields = sorted(extracted_fields)
                                 self.json_fields[json_file] = json_fields
                             
-                            # Check null categories from already-loaded data
-                            null_categories = {}
-                            if isinstance(json_data, dict):
-                                for key, value in json_data.items():
-                                    null_categories[key] = (value is None) or (isinstance(value, list) and len(value) == 0)
-                            elif isinstance(json_data, list) and len(json_data) > 0 and isinstance(json_data[0], dict):
-                                for key, value in json_data[0].items():
-                                    null_categories[key] = (value is None) or (isinstance(value, list) and len(value) == 0)
-                            
-                            # Get array field mapping from already-loaded data
-                            array_field_mapping = self.json_parser._extract_array_fields_recursive(json_data)
-                            
                             # Clean special characters from JSON data if configured for this database
                             if json_data and database:
                                 cleaned_data, chars_removed = self.json_parser.clean_special_characters(json_data, database)
@@ -1298,47 +1300,29 @@ Report saved to: {report_path}
                                     # Update UI with current record being processed
                                     if record_idx % 100 == 0 or record_idx == 1 or record_idx == len(records):
                                         self.update_progress(processed, total_files, f"Processing {os.path.basename(json_file)}: Record {record_idx}/{len(records)}")
-                                    # Extract fields from this specific record
-                                    record_fields = self.json_parser.extract_fields_from_record(record)
-                                    
-                                    # Check for null categories in this record
-                                    record_null_categories = {}
-                                    if isinstance(record, dict):
-                                        for key, value in record.items():
-                                            if value is None:
-                                                record_null_categories[key] = True
-                                            elif isinstance(value, list) and len(value) == 0:
-                                                record_null_categories[key] = True
-                                            else:
-                                                record_null_categories[key] = False
-                                    
-                                    # Get array field mapping for this record
-                                    # First, get mapping from JSON (fields that actually exist in non-empty arrays)
-                                    record_array_mapping = {}
-                                    if isinstance(record, dict):
-                                        for key, value in record.items():
-                                            if isinstance(value, list):
-                                                for item in value:
-                                                    if isinstance(item, dict):
-                                                        for field_name in item.keys():
-                                                            normalized_field = field_name.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
-                                                            record_array_mapping[normalized_field] = key
+                                    # Extract fields, array field mapping (fields that actually exist in
+                                    # non-empty arrays) and null categories from this specific record
+                                    record_fields, record_array_mapping, record_null_categories = (
+                                        self.json_parser.extract_record_metadata(record)
+                                    )
                                     
                                     # Also add database field-to-array mappings for fields that belong to arrays
                                     # This ensures fields from null/empty arrays in JSON can still be matched
                                     # Normalize database field names and map them to their arrays
+                                    # Normalize the record's keys once rather than once per database field
+                                    normalized_record_keys = (
+                                        {key.translate(_FIELD_NAME_SEPS).lower() for key in record}
+                                        if isinstance(record, dict) else set()
+                                    )
                                     for db_field, array_name in field_category_mapping.items():
                                         # Normalize the database field name for comparison
-                                        normalized_db_field = db_field.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
+                                        normalized_db_field = db_field.translate(_FIELD_NAME_SEPS).lower()
                                         # Only add if not already in record_array_mapping (JSON mapping takes precedence)
                                         if normalized_db_field not in record_array_mapping:
                                             # Normalize array name to match JSON array names
-                                            normalized_array = array_name.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
+                                            normalized_array = array_name.translate(_FIELD_NAME_SEPS).lower()
                                             # Check if this array exists in the record (even if null/empty)
-                                            if isinstance(record, dict) and any(
-                                                key.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower() == normalized_array 
-                                                for key in record.keys()
-                                            ):
+                                            if normalized_array in normalized_record_keys:
                                                 record_array_mapping[normalized_db_field] = array_name
                                     
                                     # Compare this record's fields
@@ -1551,25 +1535,14 @@ Report saved to: {report_path}
                                 processed += 1
                                 continue
                             
-                            # Extract fields from already-loaded data (avoid re-reading file)
+                            # Extract fields, null categories and array field mapping from already-loaded data in one pass
+                            extracted_fields, array_field_mapping, null_categories = self.json_parser.extract_field_metadata(json_data)
                             if json_file in self.json_fields:
                                 json_fields = self.json_fields[json_file]
                             else:
-                                json_fields = sorted(list(set(self.json_parser._extract_all_fields(json_data))))
+                                json_fields = sorted(extracted_fields)
                                 self.json_fields[json_file] = json_fields
                             
-                            # Check null categories from already-loaded data
-                            null_categories = {}
-                            if isinstance(json_data, dict):
-                                for key, value in json_data.items():
-                                    null_categories[key] = (value is None) or (isinstance(value, list) and len(value) == 0)
-                            elif isinstance(json_data, list) and len(json_data) > 0 and isinstance(json_data[0], dict):
-                                for key, value in json_data[0].items():
-                                    null_categories[key] = (value is None) or (isinstance(value, list) and len(value) == 0)
-                            
-                            # Get array field mapping from already-loaded data
-                            array_field_mapping = self.json_parser._extract_array_fields_recursive(json_data)
-                            
                             # Clean special characters from JSON data if configured for this database
                             if json_data and database:
                                 cleaned_data, chars_removed = self.json_parser.clean_special_characters(json_data, database)
@@ -1659,47 +1632,29 @@ Report saved to: {report_path}
                                     if record_idx % 100 == 0 or record_idx == 1 or record_idx == len(records):
                                         self.update_progress(processed, total_files, f"Processing {os.path.basename(json_file)}: Record {record_idx}/{len(records)}")
                                     
-                                    # Extract fields from this specific record
-                                    record_fields = self.json_parser.extract_fields_from_record(record)
-                                    
-                                    # Check for null categories in this record
-                                    record_null_categories = {}
-                                    if isinstance(record, dict):
-                                        for key, value in record.items():
-                                            if value is None:
-                                                record_null_categories[key] = True
-                                            elif isinstance(value, list) and len(value) == 0:
-                                                record_null_categories[key] = True
-                                            else:
-                                                record_null_categories[key] = False
-                                    
-                                    # Get array field mapping for this record
-                                    # First, get mapping from JSON (fields that actually exist in non-empty arrays)
-                                    record_array_mapping = {}
-                                    if isinstance(record, dict):
-                                        for key, value in record.items():
-                                            if isinstance(value, list):
-                                                for item in value:
-                                                    if isinstance(item, dict):
-                                                        for field_name in item.keys():
-                                                            normalized_field = field_name.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
-                                                            record_array_mapping[normalized_field] = key
+                                    # Extract fields, array field mapping (fields that actually exist in
+                                    # non-empty arrays) and null categories from this specific record
+                                    record_fields, record_array_mapping, record_null_categories = (
+                                        self.json_parser.extract_record_metadata(record)
+                                    )
                                     
                                     # Also add database field-to-array mappings for fields that belong to arrays
                                     # This ensures fields from null/empty arrays in JSON can still be matched
                                     # Normalize database field names and map them to their arrays
+                                    # Normalize the record's keys once rather than once per database field
+                                    normalized_record_keys = (
+                                        {key.translate(_FIELD_NAME_SEPS).lower() for key in record}
+                                        if isinstance(record, dict) else set()
+                                    )
                                     for db_field, array_name in field_category_mapping.items():
                                         # Normalize the database field name for comparison
-                                        normalized_db_field = db_field.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
+                                        normalized_db_field = db_field.translate(_FIELD_NAME_SEPS).lower()
                                         # Only add if not already in record_array_mapping (JSON mapping takes precedence)
                                         if normalized_db_field not in record_array_mapping:
                                             # Normalize array name to match JSON array names
-                                            normalized_array = array_name.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower()
+                                            normalized_array = array_name.translate(_FIELD_NAME_SEPS).lower()
                                             # Check if this array exists in the record (even if null/empty)
-                                            if isinstance(record, dict) and any(
-                                                key.replace(' ', '').replace('_', '').replace('-', '').replace('.', '').lower() == normalized_array 
-                                                for key in record.keys()
-                                            ):
+                                            if normalized_array in normalized_record_keys:
                                                 record_array_mapping[normalized_db_field] = array_name
                                     
                                     # Compare this record's fields
@@ -1806,6 +1761,8 @@ Report saved to: {report_path}
             # Clear previous results first
             for item in self.results_tree.get_children():
                 self.results_tree.delete(item)
+            self.evolvus_field_names.clear()
+            self.result_rows.clear()
             
             # Check if we have any results
             if not all_results or len(all_results) == 0:
@@ -1882,14 +1839,18 @@ Report saved to: {report_path}
                         unmatched_json_count += 1
                         tag = 'unmatched_json'
                     
+                    row_values = (display_status,
+                                  result.get('db_field', ''),
+                                  result.get('json_field', ''),
+                                  match_type)
                     try:
                         self.results_tree.insert("", tk.END,
                                                text=field_name,
-                                               values=(display_status, 
-                                                      result.get('db_field', ''),
-                                                      result.get('json_field', ''),
-                                                      match_type),
+                                               values=row_values,
                                                tags=(tag,))
+                        self.result_rows.append((field_name, row_values))
+                        if 'evolvus' in field_name.casefold():
+                            self.evolvus_field_names.add(field_name)
                     except Exception as e:
                         logger.error(f"Error inserting result into tree: {str(e)}. Result: {result}")
                         continue
@@ -1991,6 +1952,8 @@ Report saved to: {report_path}
             # Clear previous results
             for item in self.results_tree.get_children():
                 self.results_tree.delete(item)
+            self.evolvus_field_names.clear()
+            self.result_rows.clear()
             
             # Display aggregated results
             matched_count = 0
@@ -2050,11 +2013,15 @@ Report saved to: {report_path}
                 elif status == 'matched':
                     display_status = 'matched'
                 
+                row_values = (display_status, '', '', match_type)
                 try:
                     self.results_tree.insert("", tk.END,
                                            text=field_name,
-                                           values=(display_status, '', '', match_type),
+                                           values=row_values,
                                            tags=(tag,))
+                    self.result_rows.append((field_name, row_values))
+                    if 'evolvus' in field_name.casefold():
+                        self.evolvus_field_names.add(field_name)
                 except Exception as e:
                     logger.error(f"Error inserting aggregated result into tree: {str(e)}. Field: {field_name}")
                     continue
@@ -2114,8 +2081,9 @@ Report saved to: {report_path}
         multi_record_files_count = 0
         total_records_with_issues = 0
         for json_file in self.json_fields.keys():
-            records = self.json_parser.get_records(json_file)
-            if len(records) > 1:
+            # Only need to know whether there is more than one record; large files are streamed
+            first_records = list(islice(self.json_parser.iter_records(json_file), 2))
+            if len(first_records) > 1:
                 multi_record_files_count += 1
                 record_info = self.record_unmatched_info.get(json_file, {})
                 total_records_with_issues += len(record_info)
@@ -2466,7 +2434,7 @@ Check the 'logs' folder for complete information.
                 field_to_chars[field_name].update(special_chars)
             
             for field in sorted(field_to_chars.keys()):
-                chars_list = sorted(list(field_to_chars[field]))
+                chars_list = sorted(field_to_chars[field])
                 chars_str = ', '.join([f"'{c}'" for c in chars_list])
                 message += f"  • {field}: special characters [{chars_str}]\n"
             message += "\n"
@@ -2503,7 +2471,7 @@ Check the 'logs' folder for complete information.
             
             for field in sorted(field_to_info.keys()):
                 info = field_to_info[field]
-                chars_list = sorted(list(info['special_chars']))
+                chars_list = sorted(info['special_chars'])
                 chars_str = ', '.join([f"'{c}'" for c in chars_list])
                 message += f"\n  • {field}:\n"
                 message += f"      Special characters: [{chars_str}]\n"
@@ -2582,7 +2550,7 @@ Check the 'logs' folder for complete information.
             
             if filename:
                 # Collect all unique unmatched JSON field names
-                unique_fields = list(set([field['field_name'] for field in unmatched_json_fields]))
+                unique_fields = list({field['field_name'] for field in unmatched_json_fields})
                 unique_fields.sort()
                 
                 # Also collect from per-record unmatched info
@@ -2640,8 +2608,7 @@ Check the 'logs' folder for complete information.
             'unmatched_json': 0
         }
         
-        for item in self.results_tree.get_children():
-            values = self.results_tree.item(item, 'values')
+        for _, values in self.result_rows:
             status = values[0]
             if status == 'matched':
                 summary['matched'] += 1
@@ -2659,9 +2626,7 @@ Check the 'logs' folder for complete information.
         unmatched_json_dict = {}    # {field_name: match_type}
         category_null_dict = {}     # {field_name: match_type}
         
-        for item in self.results_tree.get_children():
-            field_name = self.results_tree.item(item, 'text')
-            values = self.results_tree.item(item, 'values')
+        for field_name, values in self.result_rows:
             display_status = values[0]
             match_type = values[3] if len(values) > 3 else ''
             
@@ -2676,16 +2641,13 @@ Check the 'logs' folder for complete information.
             if status == 'unmatched_db':
                 if 'category_null' in match_type:
                     # Store for reference but don't count as unmatched
-                    if field_name not in category_null_dict:
-                        category_null_dict[field_name] = match_type
+                    category_null_dict.setdefault(field_name, match_type)
                 else:
                     # Only store once per field name (deduplicate)
-                    if field_name not in unmatched_db_dict:
-                        unmatched_db_dict[field_name] = match_type
+                    unmatched_db_dict.setdefault(field_name, match_type)
             elif status == 'unmatched_json':
                 # Only store once per field name (deduplicate)
-                if field_name not in unmatched_json_dict:
-                    unmatched_json_dict[field_name] = match_type
+                unmatched_json_dict.setdefault(field_name, match_type)
         
         # Convert dictionaries to lists
         unmatched_fields = {
@@ -2712,12 +2674,7 @@ Check the 'logs' folder for complete information.
         if database:
             field_category_mapping = self.field_loader.get_field_category_mapping(database)
         
-        # Normalize evolvus_id for comparison
-        evolvus_id_normalized = 'evolvusid'.replace(' ', '').replace('_', '').replace('-', '').lower()
-        
-        for item in self.results_tree.get_children():
-            field_name = self.results_tree.item(item, 'text')
-            values = self.results_tree.item(item, 'values')
+        for field_name, values in self.result_rows:
             status = values[0]
             match_type = values[3] if len(values) > 3 else ''
             
@@ -2728,8 +2685,8 @@ Check the 'logs' folder for complete information.
             # Check if field belongs to evolvus_id category
             category = field_category_mapping.get(field_name, '')
             if category:
-                normalized_cat = category.replace(' ', '').replace('_', '').replace('-', '').lower()
-                if normalized_cat == evolvus_id_normalized:
+                normalized_cat = category.translate(_STRIP_SEPS).lower()
+                if normalized_cat == _EVOLVUS_ID_NORM:
                     if status == 'unmatched_db':
                         unmatched_fields['unmatched_db'].append({
                             'field_name': field_name,
@@ -2743,7 +2700,7 @@ Check the 'logs' folder for complete information.
                             'category': category
                         })
             # Also check if field name itself contains evolvus_id pattern
-            elif 'evolvus' in field_name.lower():
+            elif field_name in self.evolvus_field_names:
                 if status == 'unmatched_db':
                     unmatched_fields['unmatched_db'].append({
                         'field_name': field_name,
@@ -2771,6 +2728,8 @@ Check the 'logs' folder for complete information.
         
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
+        self.evolvus_field_names.clear()
+        self.result_rows.clear()
         
         self.summary_text.delete(1.0, tk.END)
         
@@ -2918,5 +2877,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed before any worker process starts when running as a frozen executable
+    multiprocessing.freeze_support()
     main()
 
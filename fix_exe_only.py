@@ -3,9 +3,45 @@ Script to update functional document to focus only on executable usage
 Removes all Python code running instructions
 """
 
+import re
 from docx import Document
 from datetime import datetime
 
+# Lowercase phrases that mark a paragraph as Python/source-code instructions
+PYTHON_PHRASES = [
+    'python field_mapper.py',
+    'running from source',
+    'pip install',
+    'requirements.txt',
+    'python 3.7',
+    'python code',
+    'command prompt',
+    'navigate to the project folder',
+]
+_PYTHON_PHRASE_RE = re.compile('|'.join(re.escape(p) for p in PYTHON_PHRASES))
+_MIN_PHRASE_LEN = min(len(p) for p in PYTHON_PHRASES)
+
+# Code-related help references and their executable-only replacements
+HELP_REPLACEMENTS = {
+    'Review README.md for additional documentation': 'Check the documentation folder',
+    'Check QUICK_START.md for quick reference': 'Refer to this user manual',
+}
+_HELP_REPLACEMENT_RE = re.compile('|'.join(re.escape(old) for old in HELP_REPLACEMENTS))
+
+# Built-in Word heading styles that end the "Method 2" section
+_HEADING_STYLES = frozenset(['Heading'] + [f'Heading {level}' for level in range(1, 10)])
+
+def _rewrite_single_run_text(para, new_text):
+    """Put new_text in the paragraph's first run and blank the rest; returns that run"""
+    runs = para.runs
+    if not runs:
+        return para.add_run(new_text)
+    # Only runs after the first need clearing; a single-run paragraph is one edit
+    for run in runs[1:]:
+        run.text = ''
+    runs[0].text = new_text
+    return runs[0]
+
 def fix_exe_only():
     doc = Document('Field_Mapper_Tool_Functional_Document_Final_20251118_170530.docx')
     
@@ -17,117 +53,88 @@ def fix_exe_only():
     
     # Track sections to remove or modify
     in_method2_section = False
+    launch_heading_pending = False
+    launch_section_updated = False
+    
+    # Snapshot the paragraphs once; doc.paragraphs rebuilds the list on every access
+    paras = list(doc.paragraphs)
     
-    for i, para in enumerate(doc.paragraphs):
-        text = para.text.lower()
+    for para in paras:
+        raw = para.text
+        # Paragraphs shorter than every phrase cannot match, so skip lowercasing them
+        if len(raw) < _MIN_PHRASE_LEN:
+            text = ''
+        else:
+            text = raw if raw.islower() else raw.lower()
         
         # Remove "Method 2: Running from Source" section
         if 'method 2:' in text and 'running from source' in text:
-            paragraphs_to_remove.append(i)
+            paragraphs_to_remove.append(para._element)
             in_method2_section = True
             print(f"  ❌ Removing: 'Method 2: Running from Source' section")
             continue
         
+        remove = False
+        
         # Remove content under Method 2 until next heading
         if in_method2_section:
-            if para.style.name.startswith('Heading'):
+            style_name = para.style.name
+            if style_name in _HEADING_STYLES:
                 in_method2_section = False
-            elif para.style.name == 'List Bullet':
-                paragraphs_to_remove.append(i)
+            elif style_name == 'List Bullet':
+                remove = True
             elif 'python field_mapper.py' in text:
-                paragraphs_to_remove.append(i)
+                remove = True
         
         # Remove Python-related content
-        python_phrases = [
-            'python field_mapper.py',
-            'running from source',
-            'pip install',
-            'requirements.txt',
-            'python 3.7',
-            'python code',
-            'command prompt',
-            'navigate to the project folder',
-        ]
+        if not remove and text:
+            match = _PYTHON_PHRASE_RE.search(text)
+            if match:
+                remove = True
+                print(f"  ❌ Removing paragraph with: '{match.group(0)}'")
         
-        for phrase in python_phrases:
-            if phrase in text and i not in paragraphs_to_remove:
-                paragraphs_to_remove.append(i)
-                print(f"  ❌ Removing paragraph with: '{phrase}'")
-                break
-    
-    # Remove marked paragraphs (in reverse to maintain indices)
-    for i in sorted(paragraphs_to_remove, reverse=True):
-        if i < len(doc.paragraphs):
-            p = doc.paragraphs[i]
-            p._element.getparent().remove(p._element)
-            changes_made += 1
-    
-    # Update "Launching the Application" section
-    for i, para in enumerate(doc.paragraphs):
-        if para.text == '2.2 Launching the Application':
-            # Find and update next paragraph
-            if i + 1 < len(doc.paragraphs):
-                next_para = doc.paragraphs[i + 1]
-                if 'two ways' in next_para.text.lower():
-                    # Update to single method
-                    for run in next_para.runs:
-                        run.text = ''
-                    if next_para.runs:
-                        next_para.runs[0].text = 'To launch the Field Mapper Tool:'
-                    else:
-                        next_para.add_run('To launch the Field Mapper Tool:')
-                    changes_made += 1
-                    print(f"  ✏️  Updated: 'Launching the Application' section")
-                    break
-    
-    # Update "Method 1" to just "How to Launch"
-    for para in doc.paragraphs:
+        # Update system requirements to remove Python mention
+        if not remove and 'Python 3.7 or higher (if running from source)' in raw:
+            remove = True
+            print(f"  ❌ Removed: Python requirement from system requirements")
+        
+        if remove:
+            paragraphs_to_remove.append(para._element)
+            continue
+        
+        # Update "Launching the Application" section (first paragraph after the heading)
+        if launch_heading_pending:
+            launch_heading_pending = False
+            if 'two ways' in raw.lower():
+                # Update to single method
+                _rewrite_single_run_text(para, 'To launch the Field Mapper Tool:')
+                launch_section_updated = True
+                changes_made += 1
+                print(f"  ✏️  Updated: 'Launching the Application' section")
+        elif not launch_section_updated and raw == '2.2 Launching the Application':
+            launch_heading_pending = True
+        
+        # Update "Method 1" to just "How to Launch"
         if 'Method 1:' in para.text and 'Using the Executable' in para.text:
-            for run in para.runs:
-                run.text = ''
-            if para.runs:
-                para.runs[0].text = 'How to Launch:'
-                para.runs[0].bold = True
-            else:
-                run = para.add_run('How to Launch:')
-                run.bold = True
+            run = _rewrite_single_run_text(para, 'How to Launch:')
+            run.bold = True
             changes_made += 1
             print(f"  ✏️  Changed: 'Method 1' → 'How to Launch'")
-    
-    # Update system requirements to remove Python mention
-    for para in doc.paragraphs:
-        if 'Python 3.7 or higher (if running from source)' in para.text:
-            # This is in a list, remove this specific item
-            p_element = para._element
-            p_element.getparent().remove(p_element)
-            changes_made += 1
-            print(f"  ❌ Removed: Python requirement from system requirements")
-    
-    # Update "Getting Help" section to remove README references with code
-    for para in doc.paragraphs:
-        original = para.text
-        new_text = original
-        
-        # Remove code-related references
-        replacements = {
-            'Review README.md for additional documentation': 'Check the documentation folder',
-            'Check QUICK_START.md for quick reference': 'Refer to this user manual',
-        }
         
-        for old, new in replacements.items():
-            if old in new_text:
-                new_text = new_text.replace(old, new)
+        # Update "Getting Help" section to remove README references with code
+        original = para.text
+        new_text = _HELP_REPLACEMENT_RE.sub(lambda m: HELP_REPLACEMENTS[m.group(0)], original)
         
         if new_text != original:
-            for run in para.runs:
-                run.text = ''
-            if para.runs:
-                para.runs[0].text = new_text
-            else:
-                para.add_run(new_text)
+            _rewrite_single_run_text(para, new_text)
             changes_made += 1
             print(f"  ✏️  Updated help reference")
     
+    # Remove marked paragraphs directly from their parent elements
+    for element in paragraphs_to_remove:
+        element.getparent().remove(element)
+        changes_made += 1
+    
     # Save updated version
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f'Field_Mapper_Tool_User_Manual_{timestamp}.docx'
@@ -4,10 +4,18 @@ Extracts field names from JSON files with support for nested structures
 """
 
 import json
+import mmap
 import os
-from typing import List, Set, Dict, Any, Optional, Tuple
+import re
+from typing import List, Set, Dict, Any, Optional, Tuple, Iterator, Callable
 import logging
 import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from json.encoder import encode_basestring
 
 # Try to import chardet for encoding detection (optional dependency)
 try:
@@ -17,85 +25,347 @@ except ImportError:
     HAS_CHARDET = False
     chardet = None  # type: ignore
 
+# Try to import orjson for faster parsing (optional dependency)
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+# Try to import ijson for streaming large record arrays (optional dependency)
+try:
+    import ijson  # type: ignore
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None  # type: ignore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Trailing comma before a closing brace/bracket (invalid JSON, but a common mistake)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# Number of parsed files (and extracted field lists) kept in memory per parser
+CACHE_MAX_FILES = 8
+
+# Files at least this large are streamed record by record in iter_records (when ijson is installed)
+STREAM_MIN_BYTES = 50 * 1024 * 1024
+
+# Stop scanning a top-level record array after this many consecutive records add no new
+# fields. 0 scans every record, which is the default because a field that only appears in
+# a late record would otherwise be missed; set it for large homogeneous exports where
+# speed matters more than catching such outliers.
+RECORD_SCAN_UNCHANGED_LIMIT = 0
+
+# extract_fields_batch only starts worker processes for at least this many uncached files
+# totalling at least this many bytes; below that, pool start-up (much slower with Windows
+# spawn) costs more than parsing the files in-process
+BATCH_PARALLEL_MIN_FILES = 4
+BATCH_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+# Returned by _navigate_path when a path does not exist
+_MISSING = object()
+
+# Returned by the memory-mapped fast path when a file must go through the text-decoding path
+_NOT_PARSED = object()
+
+# Decoded encodings whose text is byte-identical to what the memory-mapped path gave orjson
+_ORJSON_TRIED_ENCODINGS = frozenset(('utf-8', 'utf-8-sig', 'ascii'))
+
+# Leading bytes (characters, once decoded) of a file examined by the minified-JSON heuristic
+MINIFIED_SAMPLE_BYTES = 64 * 1024
+
+# Parsed JSON container types; values of any other type are leaves
+_CONTAINER_TYPES = frozenset((dict, list))
+
+# Characters dropped when normalizing field names (same set as FieldComparator)
+_FIELD_NAME_STRIP = str.maketrans('', '', ' _-.')
+
+# Characters dropped when matching field names against SPECIAL_CHAR_REMOVAL (clean_special_characters)
+_CONFIG_NAME_STRIP = str.maketrans('', '', ' _-.:')
+
+
+@lru_cache(maxsize=8192)
+def _normalize_field_name(field_name: str) -> str:
+    """Normalize field name for comparison: drop spaces, underscores, hyphens and dots, then lowercase"""
+    return sys.intern(field_name.translate(_FIELD_NAME_STRIP).lower())
+
+
+@lru_cache(maxsize=8192)
+def _normalize_config_name(name: str) -> str:
+    """Normalize a field name for SPECIAL_CHAR_REMOVAL lookups: lowercase, then drop spaces, _ - . and :"""
+    return name.lower().translate(_CONFIG_NAME_STRIP)
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Split a dot-notation path once into (key, list_index) steps; list_index is None for non-numeric keys"""
+    return tuple((sys.intern(key), int(key) if key.isdigit() else None) for key in path.split('.'))
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    """
+    Read a whole file with os.read on a raw descriptor (no BufferedReader / TextIOWrapper layers)
+    
+    The first read asks for the file size in one call; further reads only happen for short
+    reads or files that grew, and stop at end of file.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size)] if size else []
+        while True:
+            chunk = os.read(fd, 1024 * 1024)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+
+# Digit runs this long may be integers outside orjson's 64-bit range (-9223372036854775809
+# already has 19 digits), which orjson would silently turn into floats
+_LONG_DIGIT_RUN = b'0' * 19
+# Maps every ASCII digit to b'0' and every other byte to b' ', so digit runs can be found
+# with a plain substring search instead of a much slower regex scan
+_DIGIT_MASK_TABLE = bytes(ord('0') if ord('0') <= i <= ord('9') else ord(' ') for i in range(256))
+
+
+def _has_long_digit_run(content: Any, chunk_size: int = 1024 * 1024) -> bool:
+    """
+    Check whether JSON content (str or bytes-like) contains a run of 19 or more ASCII digits
+    
+    Such a run may be an integer orjson cannot represent exactly, so callers parse the
+    content with the stdlib json module instead. Runs inside strings also match; that only
+    costs a slower parse, never a wrong result. Scanned in chunks to keep memory flat.
+    """
+    overlap = len(_LONG_DIGIT_RUN) - 1
+    is_text = isinstance(content, str)
+    view = content if is_text else memoryview(content).cast('B')
+    try:
+        for start in range(0, len(view), chunk_size):
+            piece = view[max(0, start - overlap):start + chunk_size]
+            piece = piece.encode('utf-8', 'surrogatepass') if is_text else bytes(piece)
+            if _LONG_DIGIT_RUN in piece.translate(_DIGIT_MASK_TABLE):
+                return True
+        return False
+    finally:
+        if not is_text:
+            view.release()
+
+
+def _loads(content: str, use_orjson: bool = True) -> Any:
+    """
+    Parse JSON text with orjson when available, falling back to the stdlib json module
+    
+    Args:
+        content: JSON text
+        use_orjson: Set to False when orjson has already rejected the same text
+    
+    orjson reads integers outside the 64-bit range as floats, so text that may contain such
+    integers is always parsed with the stdlib json module (which keeps them exact).
+    """
+    if use_orjson and HAS_ORJSON and not _has_long_digit_run(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN/Infinity literals);
+            # let the stdlib parser decide so those files keep loading
+            pass
+    return json.loads(content)
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Check whether parsed JSON contains NaN or +/-Infinity (which orjson would write as null)"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
+        elif node_type is float and (node != node or node in (float('inf'), float('-inf'))):
+            return True
+    return False
+
+
+def _dumps_indented(data: Any) -> bytes:
+    """
+    Serialize data as UTF-8 JSON indented by 2 spaces (same layout as json.dump(indent=2, ensure_ascii=False))
+    
+    orjson is used when it can represent the data exactly; the stdlib encoder handles
+    NaN/Infinity, integers outside the 64-bit range and non-string keys.
+    """
+    if HAS_ORJSON and not _has_non_finite_float(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class JSONParser:
+    __slots__ = ('field_cache', 'json_data_cache', 'logged_files')
+    
     def __init__(self):
-        self.field_cache = {}
-        self.json_data_cache = {}  # Cache loaded JSON data to avoid reloading
+        self.field_cache = OrderedDict()  # {(abs_path, json_path): (file_stamp, fields)}
+        self.json_data_cache = OrderedDict()  # Cache loaded JSON data to avoid reloading: {abs_path: (file_stamp, data)}
         self.logged_files = set()  # Track which files we've already logged
     
-    def _detect_encoding(self, file_path: str) -> str:
+    @staticmethod
+    def _file_stamp(file_path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) used to detect changes to a cached file, or None if unavailable"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _cache_key(file_path: str) -> str:
+        """Return the key a file is cached under, so different spellings of one path share an entry"""
+        return os.path.abspath(file_path)
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any, stamp: Optional[Tuple[int, int]]) -> Any:
+        """Return the cached value for key if it was stored for the same file stamp, else None"""
+        if stamp is None:
+            return None
+        entry = cache.get(key)
+        if entry is None or entry[0] != stamp:
+            return None
+        cache.move_to_end(key)
+        return entry[1]
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: Any, stamp: Optional[Tuple[int, int]], value: Any):
+        """Store value for key, evicting the least recently used entries beyond CACHE_MAX_FILES"""
+        if stamp is None:
+            return
+        cache[key] = (stamp, value)
+        cache.move_to_end(key)
+        while len(cache) > CACHE_MAX_FILES:
+            cache.popitem(last=False)
+    
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Drop cached data for a file so the next call re-reads it from disk
+        
+        Args:
+            file_path: File to forget; if None, clear all cached files
+        """
+        if file_path is None:
+            self.json_data_cache.clear()
+            self.field_cache.clear()
+            return
+        cache_key = self._cache_key(file_path)
+        self.json_data_cache.pop(cache_key, None)
+        for key in [key for key in self.field_cache if key[0] == cache_key]:
+            del self.field_cache[key]
+    
+    @staticmethod
+    def _sniff_encoding(head: bytes) -> Optional[str]:
         """
-        Detect file encoding using multiple methods
+        Identify a Unicode encoding from the first 4 bytes of a JSON file (RFC 8259 / RFC 4627)
+        
+        A byte order mark decides the encoding; without one, the NUL bytes around the
+        first (ASCII) character give away UTF-16 and UTF-32.
+        
+        Args:
+            head: First bytes of the file (at least 4 for the NUL patterns)
         
         Returns:
-            Detected encoding name, or 'utf-8' as default
+            Encoding name, or None if nothing distinguishes the file from UTF-8
+        """
+        if head.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if head.startswith((b'\xff\xfe\x00\x00', b'\x00\x00\xfe\xff')):
+            return 'utf-32'
+        if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+            return 'utf-16'
+        if len(head) >= 4:
+            if head[0] == 0 and head[1] == 0 and head[2] == 0:
+                return 'utf-32-be'
+            if head[1] == 0 and head[2] == 0 and head[3] == 0:
+                return 'utf-32-le'
+            if head[0] == 0 and head[2] == 0:
+                return 'utf-16-be'
+            if head[1] == 0 and head[3] == 0:
+                return 'utf-16-le'
+        return None
+    
+    def _detect_encoding(self, raw_data: bytes) -> Optional[str]:
         """
-        # List of encodings to try (in order of preference)
-        common_encodings = ['utf-8', 'utf-8-sig']
+        Guess a legacy (non-Unicode) encoding with chardet
         
-        # Try chardet if available (more accurate detection)
-        if HAS_CHARDET:
-            try:
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read(10000)  # Read first 10KB for detection
-                    if raw_data:
-                        result = chardet.detect(raw_data)
-                        if result and result.get('encoding'):
-                            detected_encoding = result['encoding'].lower()
-                            confidence = result.get('confidence', 0)
-                            # Only use if confidence is reasonable
-                            if confidence > 0.7:
-                                # Normalize encoding name
-                                if detected_encoding.startswith('utf-8'):
-                                    return 'utf-8'
-                                elif detected_encoding.startswith('utf-16'):
-                                    return 'utf-16'
-                                # Add detected encoding to try list if not already there
-                                if detected_encoding not in common_encodings:
-                                    common_encodings.insert(1, detected_encoding)
-            except Exception as e:
-                logger.debug(f"Failed to detect encoding with chardet for {file_path}: {str(e)}")
+        Args:
+            raw_data: File content; only the first 10KB are examined
         
-        # Try common encodings in order
-        for encoding in common_encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read(1)  # Try to read at least one character
-                return encoding
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-            except Exception:
-                continue
+        Returns:
+            Detected encoding name, or None if chardet is unavailable or not confident
+        """
+        if not HAS_CHARDET or not raw_data:
+            return None
+        
+        try:
+            result = chardet.detect(raw_data[:10000])  # First 10KB is enough for detection
+        except Exception as e:
+            logger.debug(f"Failed to detect encoding with chardet: {str(e)}")
+            return None
         
-        # Default to utf-8 if all else fails
-        return 'utf-8'
+        if result and result.get('encoding') and result.get('confidence', 0) > 0.7:
+            # Normalize encoding name
+            detected_encoding = result['encoding'].lower()
+            if detected_encoding.startswith('utf-8'):
+                return 'utf-8'
+            elif detected_encoding.startswith('utf-16'):
+                return 'utf-16'
+            return detected_encoding
+        return None
     
     def _read_file_with_encoding(self, file_path: str) -> Tuple[str, str]:
         """
         Read file content trying multiple encodings
         
+        The file is read once as bytes and decoded in memory. The encoding comes from a
+        byte order mark / NUL-pattern sniff, then UTF-8; chardet is only consulted once
+        those have failed.
+        
         Returns:
             Tuple of (content, encoding_used)
         """
-        # Detect encoding first
-        detected_encoding = self._detect_encoding(file_path)
+        raw_data = _read_file_bytes(file_path)
+        
+        detected_encoding = self._sniff_encoding(raw_data[:4]) or 'utf-8'
         
-        # List of encodings to try (detected first, then fallbacks)
-        encodings_to_try = [detected_encoding, 'utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be']
-        # Remove duplicates while preserving order
-        seen = set()
-        encodings_to_try = [enc for enc in encodings_to_try if not (enc in seen or seen.add(enc))]
+        def candidate_encodings():
+            yield detected_encoding
+            yield 'utf-8'
+            # Slow path: only reached when the file is not valid UTF-8
+            legacy_encoding = self._detect_encoding(raw_data)
+            if legacy_encoding:
+                yield legacy_encoding
+            yield from ('utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be')
         
+        tried = set()
         last_error = None
-        for encoding in encodings_to_try:
+        for encoding in candidate_encodings():
+            if encoding in tried:
+                continue
+            tried.add(encoding)
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                # If we get here, reading was successful
+                content = raw_data.decode(encoding)
+                # If we get here, decoding was successful
                 if detected_encoding != encoding:
                     logger.debug(f"File {file_path} read with {encoding} (detected: {detected_encoding})")
                 return content, encoding
@@ -122,9 +392,86 @@ class JSONParser:
         """
         Load JSON file with error handling for malformed JSON and automatic encoding detection
         
+        Parsed data is cached per file and reused until the file's modification time or
+        size changes. Callers must not modify the returned data.
+        
         Returns:
             Dict, List, or other JSON-serializable type depending on file content
         """
+        cache_key = self._cache_key(file_path)
+        stamp = self._file_stamp(file_path)
+        data = self._cache_get(self.json_data_cache, cache_key, stamp)
+        if data is not None:
+            return data
+        
+        data = self._load_json_uncached(file_path)
+        if data is not None:
+            self._cache_put(self.json_data_cache, cache_key, stamp, data)
+        return data
+    
+    def _load_json_mapped(self, file_path: str) -> Any:
+        """
+        Fast path: parse a UTF-8 file straight from a memory map with orjson, without decoding it to str
+        
+        Returns:
+            Parsed data, or _NOT_PARSED if the file needs the text path (orjson not installed,
+            empty file, UTF-16/32 byte order mark, integers orjson may not hold exactly,
+            not valid UTF-8, or JSON that orjson rejects)
+        """
+        if not HAS_ORJSON:
+            return _NOT_PARSED
+        
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return _NOT_PARSED
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # UTF-16/32 byte order marks need the encoding-aware text path
+                    if mm[:2] in (b'\xff\xfe', b'\xfe\xff') or mm[:4] == b'\x00\x00\xfe\xff':
+                        return _NOT_PARSED
+                    start = 3 if mm[:3] == b'\xef\xbb\xbf' else 0
+                    with memoryview(mm) as view:
+                        body = view[start:]
+                        try:
+                            # Possible integers outside the 64-bit range: _loads keeps them exact
+                            if _has_long_digit_run(body):
+                                return _NOT_PARSED
+                            data = orjson.loads(body)
+                        finally:
+                            body.release()
+                    sample = mm[start:start + MINIFIED_SAMPLE_BYTES]
+        except (OSError, ValueError):
+            # orjson.JSONDecodeError is a ValueError; the text path reports real errors
+            return _NOT_PARSED
+        
+        if file_path not in self.logged_files:
+            is_minified = self._is_json_minified(sample.decode('utf-8', 'ignore'))
+            if is_minified:
+                logger.info(f"JSON file {file_path} appears to be minified (no indentation)")
+            self._log_structure(file_path, data, is_minified)
+        return data
+    
+    def _log_structure(self, file_path: str, data: Any, is_minified: bool):
+        """Log the structure type of a freshly parsed file (only once per file)"""
+        if file_path in self.logged_files:
+            return
+        if isinstance(data, list):
+            logger.info(f"JSON file {file_path} contains an array with {len(data)} record(s)")
+        elif isinstance(data, dict):
+            logger.info(f"JSON file {file_path} contains a single object")
+        else:
+            logger.info(f"JSON file {file_path} contains a {type(data).__name__} value")
+        
+        if is_minified:
+            logger.info(f"Successfully parsed minified JSON from {file_path}")
+        self.logged_files.add(file_path)
+    
+    def _load_json_uncached(self, file_path: str) -> Any:
+        """Read and parse a JSON file from disk (see load_json)"""
+        data = self._load_json_mapped(file_path)
+        if data is not _NOT_PARSED:
+            return data
+        
         try:
             # Read file with automatic encoding detection
             content, encoding_used = self._read_file_with_encoding(file_path)
@@ -138,42 +485,27 @@ class JSONParser:
             if is_minified:
                 logger.info(f"JSON file {file_path} appears to be minified (no indentation)")
             
-            # Try to parse JSON (minified JSON is still valid JSON)
+            # Drop a byte order mark left by the decoder before parsing (e.g. UTF-8 files read as 'utf-8')
+            if content.startswith('\ufeff'):
+                content = content[1:]
+            
+            # Try to parse JSON (minified JSON is still valid JSON).
+            # UTF-8 text reaching this point was rejected by orjson in _load_json_mapped (or may
+            # hold integers orjson cannot represent), so go straight to the stdlib parser.
             try:
-                data = json.loads(content)
+                data = _loads(content, use_orjson=encoding_used not in _ORJSON_TRIED_ENCODINGS)
                 
                 # Log the structure type for debugging (only once per file)
-                if file_path not in self.logged_files:
-                    if isinstance(data, list):
-                        logger.info(f"JSON file {file_path} contains an array with {len(data)} record(s)")
-                    elif isinstance(data, dict):
-                        logger.info(f"JSON file {file_path} contains a single object")
-                    else:
-                        logger.info(f"JSON file {file_path} contains a {type(data).__name__} value")
-                    
-                    if is_minified:
-                        logger.info(f"Successfully parsed minified JSON from {file_path}")
-                    self.logged_files.add(file_path)
+                self._log_structure(file_path, data, is_minified)
                 
                 return data
             except json.JSONDecodeError as e:
                 # Try to fix common JSON issues
                 logger.warning(f"JSON decode error in {file_path}: {str(e)}. Attempting to fix...")
                 
-                # Try removing BOM if present
-                if content.startswith('\ufeff'):
-                    content = content[1:]
-                    try:
-                        data = json.loads(content)
-                        logger.info(f"Fixed JSON by removing BOM in {file_path}")
-                        return data
-                    except json.JSONDecodeError:
-                        pass
-                
                 # Try to fix trailing commas (not valid in JSON but common mistake)
-                import re
                 # Remove trailing commas before } or ]
-                content_fixed = re.sub(r',(\s*[}\]])', r'\1', content)
+                content_fixed = _TRAILING_COMMA_RE.sub(r'\1', content)
                 if content_fixed != content:
                     try:
                         data = json.loads(content_fixed)
@@ -203,21 +535,22 @@ class JSONParser:
         Returns:
             True if JSON appears to be minified, False otherwise
         """
-        if not content or len(content.strip()) == 0:
+        # Only the start of the content matters; never strip or scan the whole (possibly very large) text
+        head = content[:MINIFIED_SAMPLE_BYTES].strip() if content else content
+        if not head:
             return False
         
-        # Remove leading/trailing whitespace
-        content = content.strip()
-        
-        # Check if it's a single line (likely minified)
-        lines = content.split('\n')
-        if len(lines) == 1 and len(content) > 100:
+        # A single line (no newline in the sample) is minified
+        if '\n' not in head:
             return True
         
+        # Inspect the first 100 lines only; maxsplit bounds the number of substrings created
+        lines = head.split('\n', 100)[:100]
+        
         # Check if there's minimal indentation (most lines have no leading spaces)
         lines_with_indent = 0
         total_lines = 0
-        for line in lines[:100]:  # Check first 100 lines
+        for line in lines:
             stripped = line.strip()
             if stripped and not stripped.startswith('//'):  # Skip empty lines and comments
                 total_lines += 1
@@ -242,6 +575,12 @@ class JSONParser:
             List of field names (empty list if file is invalid or malformed)
         """
         try:
+            cache_key = (self._cache_key(file_path), json_path)
+            stamp = self._file_stamp(file_path)
+            cached_fields = self._cache_get(self.field_cache, cache_key, stamp)
+            if cached_fields is not None:
+                return list(cached_fields)
+            
             data = self.load_json(file_path)
             
             # If data is None or empty (malformed JSON), return empty list
@@ -259,13 +598,9 @@ class JSONParser:
             
             # If json_path is specified, navigate to that section
             if json_path:
-                try:
-                    data = self._navigate_path(data, json_path)
-                    if data is None:
-                        logger.warning(f"JSON path '{json_path}' not found in {file_path}")
-                        return []
-                except Exception as e:
-                    logger.warning(f"Failed to navigate JSON path '{json_path}' in {file_path}: {str(e)}")
+                data = self._navigate_path(data, json_path)
+                if data is _MISSING:
+                    logger.warning(f"JSON path '{json_path}' not found in {file_path}")
                     return []
             
             # Extract all field names
@@ -279,7 +614,9 @@ class JSONParser:
             else:
                 logger.info(f"Extracted {len(fields)} fields from {file_path}")
             
-            return sorted(list(set(fields)))  # Remove duplicates and sort
+            fields = sorted(fields)  # Already a set (deduplicated); sort once
+            self._cache_put(self.field_cache, cache_key, stamp, fields)
+            return list(fields)
             
         except Exception as e:
             logger.error(f"Failed to extract fields from {file_path}: {str(e)}")
@@ -298,12 +635,44 @@ class JSONParser:
             List of field names from this record
         """
         try:
-            fields = self._extract_all_fields(record, prefix, exclude_categories=False)
-            return sorted(list(set(fields)))
+            fields = self._extract_all_fields(record, prefix)
+            return sorted(fields)
         except Exception as e:
             logger.error(f"Failed to extract fields from record: {str(e)}")
             return []
     
+    def extract_record_metadata(self, record: Dict) -> Tuple[List[str], Dict[str, str], Dict[str, bool]]:
+        """
+        Collect everything the per-record comparison needs from a single record
+        
+        The null categories and the array field mapping both come from the record's top-level
+        values, so they are built together in one pass over record.items().
+        
+        Args:
+            record: Single JSON record (dict)
+        
+        Returns:
+            Tuple of (fields, array_field_mapping, null_categories):
+            fields as returned by extract_fields_from_record, normalized field name -> array name
+            for objects in the record's own arrays, and category name -> True if null or empty array
+        """
+        fields = self.extract_fields_from_record(record)
+        field_to_array = {}
+        null_categories = {}
+        
+        if isinstance(record, dict):
+            for key, value in record.items():
+                if type(value) is list:
+                    null_categories[key] = not value
+                    for item in value:
+                        if type(item) is dict:
+                            for field_name in item:
+                                field_to_array[_normalize_field_name(field_name)] = key
+                else:
+                    null_categories[key] = value is None
+        
+        return fields, field_to_array, null_categories
+    
     def get_records(self, file_path: str, json_path: Optional[str] = None) -> List[Dict]:
         """
         Get all records from a JSON file (for per-record processing)
@@ -323,16 +692,13 @@ class JSONParser:
             
             # If json_path is specified, navigate to that section
             if json_path:
-                try:
-                    data = self._navigate_path(data, json_path)
-                    if data is None:
-                        return []
-                except Exception:
+                data = self._navigate_path(data, json_path)
+                if data is _MISSING:
                     return []
             
             # If it's an array, return all items
             if isinstance(data, list):
-                return [item for item in data if isinstance(item, dict)]
+                return [item for item in data if type(item) is dict]
             # If it's a single object, return it as a list with one item
             elif isinstance(data, dict):
                 return [data]
@@ -343,6 +709,47 @@ class JSONParser:
             logger.error(f"Failed to get records from {file_path}: {str(e)}")
             return []
     
+    def iter_records(self, file_path: str, json_path: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Iterate over records in a JSON file without keeping the whole document in memory
+        
+        Large files whose root is an array are streamed one record at a time with ijson
+        (when installed). Everything else falls back to get_records.
+        
+        Args:
+            file_path: Path to JSON file
+            json_path: Optional path to specific section (disables streaming)
+        
+        Yields:
+            Records (dicts), in file order
+        """
+        if HAS_IJSON and not json_path and self._is_streamable_array(file_path):
+            try:
+                with open(file_path, 'rb') as f:
+                    if f.read(3) != b'\xef\xbb\xbf':
+                        f.seek(0)
+                    for item in ijson.items(f, 'item', use_float=True):
+                        if type(item) is dict:
+                            yield item
+            except Exception as e:
+                logger.error(f"Failed to stream records from {file_path}: {str(e)}")
+            return
+        
+        yield from self.get_records(file_path, json_path)
+    
+    def _is_streamable_array(self, file_path: str) -> bool:
+        """Check whether a file is large enough to stream and starts with a UTF-8 JSON array"""
+        try:
+            if os.path.getsize(file_path) < STREAM_MIN_BYTES:
+                return False
+            with open(file_path, 'rb') as f:
+                head = f.read(1024)
+        except OSError:
+            return False
+        if head.startswith(b'\xef\xbb\xbf'):
+            head = head[3:]
+        return head.lstrip().startswith(b'[')
+    
     def check_null_categories(self, file_path: str, json_path: Optional[str] = None) -> Dict[str, bool]:
         """
         Check which parent categories are null or empty arrays in JSON
@@ -355,6 +762,13 @@ class JSONParser:
             Dictionary mapping category names to True if null or empty array, False otherwise
         """
         try:
+            # Only the first record of a root array is inspected, so a large array that is
+            # not already parsed is read up to the end of its first record instead
+            if not json_path and not self._is_cached(file_path):
+                first_record = self._stream_first_record(file_path)
+                if first_record is not _NOT_PARSED:
+                    return self._null_categories(first_record)
+            
             data = self.load_json(file_path)
             
             # If data is empty (malformed JSON), return empty dict
@@ -363,43 +777,48 @@ class JSONParser:
             
             # If json_path is specified, navigate to that section
             if json_path:
-                try:
-                    data = self._navigate_path(data, json_path)
-                    if data is None:
-                        return {}
-                except Exception:
+                data = self._navigate_path(data, json_path)
+                if data is _MISSING:
                     return {}
             
-            null_categories = {}
-            
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    # Check if value is null or empty array
-                    if value is None:
-                        null_categories[key] = True
-                    elif isinstance(value, list) and len(value) == 0:
-                        null_categories[key] = True
-                    else:
-                        null_categories[key] = False
-            elif isinstance(data, list):
-                # Root is an array - check arrays within each record
-                # Process first record to get structure (assuming all records have similar structure)
-                if len(data) > 0 and isinstance(data[0], dict):
-                    for key, value in data[0].items():
-                        # Check if value is null or empty array
-                        if value is None:
-                            null_categories[key] = True
-                        elif isinstance(value, list) and len(value) == 0:
-                            null_categories[key] = True
-                        else:
-                            null_categories[key] = False
-            
-            return null_categories
+            return self._null_categories(data)
             
         except Exception as e:
             logger.error(f"Failed to check null categories: {str(e)}")
             return {}
     
+    def _is_cached(self, file_path: str) -> bool:
+        """Check whether load_json would return this file from the cache"""
+        return self._cache_get(self.json_data_cache, self._cache_key(file_path), self._file_stamp(file_path)) is not None
+    
+    def _stream_first_record(self, file_path: str) -> Any:
+        """
+        Parse only the first element of a large root array with ijson
+        
+        Returns:
+            The first element (None for an empty array), or _NOT_PARSED if the file
+            is not a streamable array or could not be read this way
+        """
+        if not HAS_IJSON or not self._is_streamable_array(file_path):
+            return _NOT_PARSED
+        try:
+            with open(file_path, 'rb') as f:
+                if f.read(3) != b'\xef\xbb\xbf':
+                    f.seek(0)
+                return next(ijson.items(f, 'item', use_float=True), None)
+        except Exception as e:
+            logger.debug(f"Failed to stream first record from {file_path}, loading whole file: {str(e)}")
+            return _NOT_PARSED
+    
+    def _null_categories(self, data: Any) -> Dict[str, bool]:
+        """Map top-level category names to True if null or empty array (first record for root arrays)"""
+        if isinstance(data, list):
+            # Root is an array - process first record to get structure (assuming all records have similar structure)
+            data = data[0] if data else None
+        if not isinstance(data, dict):
+            return {}
+        return {key: value is None or (type(value) is list and not value) for key, value in data.items()}
+    
     def get_array_field_mapping(self, file_path: str, json_path: Optional[str] = None) -> Dict[str, str]:
         """
         Detect which fields are inside arrays in JSON and map them to their parent array name
@@ -420,11 +839,8 @@ class JSONParser:
             
             # If json_path is specified, navigate to that section
             if json_path:
-                try:
-                    data = self._navigate_path(data, json_path)
-                    if data is None:
-                        return {}
-                except Exception:
+                data = self._navigate_path(data, json_path)
+                if data is _MISSING:
                     return {}
             
             field_to_array = {}
@@ -432,29 +848,29 @@ class JSONParser:
             if isinstance(data, dict):
                 for key, value in data.items():
                     # If value is an array, extract fields from array elements
-                    if isinstance(value, list):
+                    if type(value) is list:
                         # Check if array is null or empty
                         if value is None or len(value) == 0:
                             continue
                         
                         # Extract fields from array elements
                         for item in value:
-                            if isinstance(item, dict):
+                            if type(item) is dict:
                                 # All fields in this dict are from the array named 'key'
                                 for field_name in item.keys():
                                     # Normalize field name
-                                    normalized_field = self._normalize_field_name(field_name)
+                                    normalized_field = _normalize_field_name(field_name)
                                     field_to_array[normalized_field] = key
                     
                     # Recursively check nested structures
-                    elif isinstance(value, dict):
+                    elif type(value) is dict:
                         nested_mapping = self._extract_array_fields_recursive(value, "")
                         field_to_array.update(nested_mapping)
             
             elif isinstance(data, list):
                 # Root is an array - process each record to find arrays within them
                 for item in data:
-                    if isinstance(item, dict):
+                    if type(item) is dict:
                         # Recursively extract array field mappings from each record
                         nested = self._extract_array_fields_recursive(item, "")
                         field_to_array.update(nested)
@@ -470,118 +886,188 @@ class JSONParser:
         field_to_array = {}
         
         if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, list):
-                    # This is an array
-                    if value is None or len(value) == 0:
-                        continue
-                    
-                    # Extract fields from array elements
-                    for item in value:
-                        if isinstance(item, dict):
-                            for field_name in item.keys():
-                                normalized_field = self._normalize_field_name(field_name)
-                                field_to_array[normalized_field] = key
-                            # Also check for nested structures in array items
-                            nested = self._extract_array_fields_recursive(item, key)
-                            field_to_array.update(nested)
-                elif isinstance(value, dict):
-                    # Recursively process nested dict
-                    nested = self._extract_array_fields_recursive(value, parent_array)
-                    field_to_array.update(nested)
+            self._walk(data, "", set(), field_to_array)
         
         return field_to_array
     
     def _normalize_field_name(self, field_name: str) -> str:
         """Normalize field name for comparison (same logic as FieldComparator)"""
-        # Remove all spaces, underscores, hyphens, and dots
-        normalized = field_name.replace(' ', '').replace('_', '').replace('-', '').replace('.', '')
-        # Convert to lowercase
-        normalized = normalized.lower()
-        return normalized
+        return _normalize_field_name(field_name)
     
     def _navigate_path(self, data: Any, path: str) -> Any:
-        """Navigate to a specific path in JSON structure"""
-        keys = path.split('.')
+        """
+        Navigate to a specific path in JSON structure
+        
+        Returns:
+            Value at the path, or _MISSING if the path does not exist or leads to null
+        """
         current = data
         
-        for key in keys:
-            if isinstance(current, dict):
+        for key, index in _compile_path(path):
+            current_type = type(current)
+            if current_type is dict:
                 current = current.get(key)
-            elif isinstance(current, list) and key.isdigit():
-                current = current[int(key)]
+            elif current_type is list and index is not None and index < len(current):
+                current = current[index]
             else:
-                raise ValueError(f"Invalid path: {path}")
+                return _MISSING
             
             if current is None:
-                raise ValueError(f"Path not found: {path}")
+                return _MISSING
         
         return current
     
-    def _extract_all_fields(self, data: Any, prefix: str = "", exclude_categories: bool = True) -> Set[str]:
+    def _extract_all_fields(self, data: Any, prefix: str = "") -> Set[str]:
         """
-        Recursively extract all field names from JSON structure
+        Extract all field names from JSON structure (iteratively, see _walk)
         
         Args:
             data: JSON data to extract from
             prefix: Prefix for nested field names
-            exclude_categories: If True, exclude top-level category names (only extract nested fields)
         """
         fields = set()
+        self._walk(data, prefix, fields, None)
+        return fields
+    
+    def extract_field_metadata(self, data: Any) -> Tuple[Set[str], Dict[str, str], Dict[str, bool]]:
+        """
+        Collect field names, array field mapping and null categories in one traversal
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                # Extract the key itself as a field (category names should be compared too)
-                field_name = f"{prefix}.{key}" if prefix else key
-                fields.add(field_name)
+        Args:
+            data: Parsed JSON data
+        
+        Returns:
+            Tuple of (fields, array_field_mapping, null_categories), the same values as
+            _extract_all_fields, _extract_array_fields_recursive and check_null_categories
+        """
+        fields = set()
+        field_to_array = {}
+        # Array mapping only starts from an object root (see _extract_array_fields_recursive)
+        self._walk(data, "", fields, field_to_array if isinstance(data, dict) else None)
+        return fields, field_to_array, self._null_categories(data)
+    
+    def _walk(self, data: Any, prefix: str, fields: Set[str], field_to_array: Optional[Dict[str, str]]):
+        """
+        Walk a JSON structure once, collecting field names and (optionally) array field mappings
+        
+        Args:
+            data: JSON data to walk
+            prefix: Prefix for nested field names
+            fields: Set that receives dotted field names
+            field_to_array: Dict that receives normalized field name -> parent array name,
+                            or None to skip array mapping below this point
+        """
+        if prefix or not isinstance(data, list):
+            self._walk_iterative(data, prefix, fields, field_to_array)
+            return
+        
+        # Top-level array of records: walk each record separately so progress can be logged
+        # For arrays, extract fields from all elements (not just first) to catch all possible fields
+        # This ensures we get all unique fields even if different records have different fields
+        record_count = len(data)
+        log_progress = record_count > 10 and logger.isEnabledFor(logging.INFO)
+        processed_count = 0
+        fields_before = len(fields)
+        unchanged_limit = RECORD_SCAN_UNCHANGED_LIMIT
+        unchanged_streak = 0
+        
+        for idx, item in enumerate(data):
+            if unchanged_limit:
+                if unchanged_streak >= unchanged_limit:
+                    logger.info(f"Stopped after {idx}/{record_count} records: the last {unchanged_streak} added no new fields")
+                    break
+                fields_seen = len(fields)
+            
+            item_type = type(item)
+            if item_type is dict:
+                if _CONTAINER_TYPES.isdisjoint(map(type, item.values())):
+                    # Flat record (no nested objects/arrays): its keys are exactly its fields
+                    fields.update(item)
+                else:
+                    self._walk_iterative(item, prefix, fields, None)
+                processed_count += 1
+                # Log progress for every 100th record of large arrays (the summary below covers the rest)
+                if log_progress and (idx + 1) % 100 == 0:
+                    logger.info("Processing record %d/%d: %d unique fields so far", idx + 1, record_count, len(fields))
+            elif item_type is list:
+                self._walk_iterative(item, prefix, fields, None)
+                processed_count += 1
+            else:
+                continue
+            
+            if unchanged_limit:
+                unchanged_streak = unchanged_streak + 1 if len(fields) == fields_seen else 0
+        
+        # Log summary if we're processing multiple records
+        if processed_count > 1:
+            total_fields_added = len(fields) - fields_before
+            logger.info(f"Processed {processed_count} records in array, extracted {total_fields_added} unique fields total")
+    
+    def _walk_iterative(self, data: Any, prefix: str, fields: Set[str], field_to_array: Optional[Dict[str, str]]):
+        """
+        Body of _walk using an explicit stack (no recursion limit on deeply nested JSON)
+        
+        Parsed JSON only contains plain dicts and lists, so node kinds are checked with
+        type() identity instead of isinstance().
+        """
+        fields_add = fields.add
+        fields_update = fields.update
+        normalize = _normalize_field_name
+        # Each entry: (node, prefix, field_to_array, name of the array the node is an element of)
+        stack = [(data, prefix, field_to_array, None)]
+        
+        while stack:
+            node, node_prefix, mapping, array_key = stack.pop()
+            node_type = type(node)
+            
+            if node_type is dict:
+                if array_key is not None:
+                    # All fields in this dict are from the array named 'array_key'
+                    for item_field in node:
+                        mapping[normalize(item_field)] = array_key
                 
-                # Handle arrays
-                if isinstance(value, list):
-                    # Also extract fields from within arrays if they contain objects/dicts
-                    # e.g., "bioactivity" array -> fields become "bioactivity.measure", "bioactivity.assay", etc.
-                    has_objects = any(isinstance(item, dict) for item in value) if value else False
-                    if has_objects:
-                        array_prefix = f"{prefix}.{key}" if prefix else key
-                        for item in value:
-                            if isinstance(item, (dict, list)):
-                                fields.update(self._extract_all_fields(item, array_prefix, exclude_categories=False))
+                prefix_dot = node_prefix + '.' if node_prefix else ''
+                
+                if _CONTAINER_TYPES.isdisjoint(map(type, node.values())):
+                    # Flat object: every key is a leaf field, so add them all in one C-level update
+                    if prefix_dot:
+                        fields_update(map(prefix_dot.__add__, node))
+                    else:
+                        fields_update(node)
                     continue
                 
-                # Recursively extract from nested structures (dicts)
-                # This extracts fields inside categories, even if the category name doesn't exist in database
-                # e.g., "some_new_category.field1" will be extracted and normalized to "field1" for comparison
-                if isinstance(value, (dict, list)):
-                    fields.update(self._extract_all_fields(value, field_name, exclude_categories=False))
-        
-        elif isinstance(data, list):
-            # For arrays, extract fields from all elements (not just first) to catch all possible fields
-            # This ensures we get all unique fields even if different records have different fields
-            processed_count = 0
-            fields_before = len(fields)
-            
-            for idx, item in enumerate(data):
-                if isinstance(item, dict):
-                    item_fields_before = len(fields)
-                    fields.update(self._extract_all_fields(item, prefix, exclude_categories=False))
-                    item_fields_added = len(fields) - item_fields_before
-                    processed_count += 1
-                    if not prefix and len(data) > 10:  # Only log for large arrays to avoid spam
-                        # Log progress for every 100th record or at milestones
-                        if (idx + 1) % 100 == 0 or idx + 1 == len(data):
-                            logger.info(f"Processing record {idx + 1}/{len(data)}: {len(fields)} unique fields so far")
-                    elif not prefix and len(data) <= 10:
-                        # For small arrays, log each record
-                        logger.info(f"Processing record {idx + 1}/{len(data)}: extracted {item_fields_added} new fields")
-                elif isinstance(item, list):
-                    fields.update(self._extract_all_fields(item, prefix, exclude_categories=False))
-                    processed_count += 1
-            
-            # Log summary if we're processing multiple records
-            if processed_count > 1 and not prefix:
-                total_fields_added = len(fields) - fields_before
-                logger.info(f"Processed {processed_count} records in array, extracted {total_fields_added} unique fields total")
-        
-        return fields
+                children = []
+                for key, value in node.items():
+                    # Extract the key itself as a field (category names should be compared too)
+                    field_name = prefix_dot + key
+                    fields_add(field_name)
+                    
+                    # Handle arrays
+                    value_type = type(value)
+                    if value_type is list:
+                        # Also extract fields from within arrays if they contain objects/dicts
+                        # e.g., "bioactivity" array -> fields become "bioactivity.measure", "bioactivity.assay", etc.
+                        if value and dict in map(type, value):
+                            for item in value:
+                                item_type = type(item)
+                                if item_type is dict:
+                                    children.append((item, field_name, mapping, key if mapping is not None else None))
+                                elif item_type is list:
+                                    children.append((item, field_name, None, None))
+                    
+                    # Extract from nested structures (dicts)
+                    # This extracts fields inside categories, even if the category name doesn't exist in database
+                    # e.g., "some_new_category.field1" will be extracted and normalized to "field1" for comparison
+                    elif value_type is dict:
+                        children.append((value, field_name, mapping, None))
+                
+                # Push in reverse so children are visited in document order (later arrays win in the mapping)
+                stack.extend(reversed(children))
+            
+            elif node_type is list:
+                for item in reversed(node):
+                    if type(item) in _CONTAINER_TYPES:
+                        stack.append((item, node_prefix, None, None))
     
     def extract_fields_from_object(self, obj: Dict, include_nested: bool = True) -> List[str]:
         """
@@ -594,15 +1080,29 @@ class JSONParser:
         Returns:
             List of field names
         """
+        if not isinstance(obj, dict):
+            return []
+        if not include_nested:
+            return list(obj)
+        
         fields = []
+        fields_append = fields.append
+        # Each entry: (prefix for the keys of a dict, iterator over its remaining items).
+        # Descending into a nested dict suspends the parent's iterator, which keeps the
+        # output in the same depth-first order as a recursive walk.
+        stack = [('', iter(obj.items()))]
         
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                fields.append(key)
+        while stack:
+            prefix_dot, items = stack[-1]
+            for key, value in items:
+                field_name = prefix_dot + key if prefix_dot else key
+                fields_append(field_name)
                 
-                if include_nested and isinstance(value, dict):
-                    nested_fields = self.extract_fields_from_object(value, include_nested)
-                    fields.extend([f"{key}.{f}" for f in nested_fields])
+                if isinstance(value, dict):
+                    stack.append((field_name + '.', iter(value.items())))
+                    break
+            else:
+                stack.pop()
         
         return fields
     
@@ -610,38 +1110,74 @@ class JSONParser:
         """Get value of a specific field using dot notation"""
         try:
             data = self.load_json(file_path)
-            keys = field_path.split('.')
-            current = data
-            
-            for key in keys:
-                if isinstance(current, dict):
-                    current = current.get(key)
-                elif isinstance(current, list) and key.isdigit():
-                    current = current[int(key)]
-                else:
-                    return None
-                
-                if current is None:
-                    return None
-            
-            return current
+            value = self._navigate_path(data, field_path)
+            return None if value is _MISSING else value
             
         except Exception as e:
             logger.error(f"Failed to get field value: {str(e)}")
             return None
     
+    def extract_fields_batch(self, file_paths: List[str], max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+        """
+        Extract field names from several JSON files, parsing uncached files in worker processes
+        
+        Small batches (fewer than BATCH_PARALLEL_MIN_FILES uncached files, or less than
+        BATCH_PARALLEL_MIN_BYTES in total) are parsed in-process.
+        
+        Args:
+            file_paths: Paths to JSON files
+            max_workers: Maximum number of worker processes (default: one per CPU, capped at file count)
+        
+        Returns:
+            Dictionary mapping file_path -> list of field names (same as extract_fields)
+        """
+        results = {}
+        pending = {}  # {file_path: file_stamp} for files not in the field cache
+        for file_path in file_paths:
+            if file_path in results or file_path in pending:
+                continue
+            stamp = self._file_stamp(file_path)
+            cached_fields = self._cache_get(self.field_cache, (self._cache_key(file_path), None), stamp)
+            if cached_fields is not None:
+                results[file_path] = list(cached_fields)
+            else:
+                pending[file_path] = stamp
+        
+        pending_bytes = sum(stamp[1] for stamp in pending.values() if stamp is not None)
+        if len(pending) >= BATCH_PARALLEL_MIN_FILES and pending_bytes >= BATCH_PARALLEL_MIN_BYTES:
+            workers = max_workers or min(len(pending), os.cpu_count() or 1)
+            # Hand files to workers in chunks to cut per-task IPC on large directories,
+            # while still leaving several chunks per worker to balance uneven file sizes
+            chunksize = max(1, min(8, len(pending) // (workers * 4)))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for file_path, fields in executor.map(_extract_fields_worker, pending, chunksize=chunksize):
+                        results[file_path] = fields
+                        if fields:
+                            self._cache_put(self.field_cache, (self._cache_key(file_path), None),
+                                            pending[file_path], list(fields))
+            except Exception as e:
+                logger.warning(f"Parallel field extraction failed, continuing sequentially: {str(e)}")
+        
+        for file_path in pending:
+            if file_path not in results:
+                results[file_path] = self.extract_fields(file_path)
+        
+        return results
+    
     def compare_structure(self, file1_path: str, file2_path: str) -> Dict:
         """Compare structure of two JSON files"""
         fields1 = set(self.extract_fields(file1_path))
         fields2 = set(self.extract_fields(file2_path))
+        common = fields1 & fields2
         
         return {
-            'file1_only': sorted(list(fields1 - fields2)),
-            'file2_only': sorted(list(fields2 - fields1)),
-            'common': sorted(list(fields1 & fields2)),
+            'file1_only': sorted(fields1 - fields2),
+            'file2_only': sorted(fields2 - fields1),
+            'common': sorted(common),
             'file1_count': len(fields1),
             'file2_count': len(fields2),
-            'common_count': len(fields1 & fields2)
+            'common_count': len(common)
         }
     
     def validate_json_structure(self, file_path: str, expected_fields: List[str]) -> Dict:
@@ -652,9 +1188,9 @@ class JSONParser:
             
             return {
                 'valid': expected_fields_set.issubset(actual_fields),
-                'missing': sorted(list(expected_fields_set - actual_fields)),
-                'extra': sorted(list(actual_fields - expected_fields_set)),
-                'matched': sorted(list(expected_fields_set & actual_fields))
+                'missing': sorted(expected_fields_set - actual_fields),
+                'extra': sorted(actual_fields - expected_fields_set),
+                'matched': sorted(expected_fields_set & actual_fields)
             }
             
         except Exception as e:
@@ -667,6 +1203,81 @@ class JSONParser:
                 'matched': []
             }
     
+    def _string_cleaner(self, database_name: str) -> Callable[[str, str], Tuple[str, int]]:
+        """
+        Build the string-cleaning function for a database's removal configuration
+        
+        Args:
+            database_name: Name of the database for configuration lookup
+        
+        Returns:
+            Function (value, field_path) -> (cleaned_value, characters_removed_count)
+        """
+        import database_config
+        
+        # Get global string removal configuration (applies to all fields)
+        global_strings_to_remove = getattr(database_config, 'GLOBAL_STRING_REMOVAL', [])
+        
+        # Get database-specific character removal configuration
+        removal_config = getattr(database_config, 'SPECIAL_CHAR_REMOVAL', {})
+        
+        # Create normalized lookup dictionary for field-specific removal
+        normalized_config = {}
+        field_config = removal_config.get(database_name, {})
+        if field_config:
+            for field_name, chars_to_remove in field_config.items():
+                normalized_name = _normalize_config_name(field_name)
+                # Single characters are all deleted in one str.translate pass; entries
+                # with longer strings keep the sequential replace() loop
+                if all(isinstance(char, str) and len(char) == 1 for char in chars_to_remove):
+                    delete_table = str.maketrans('', '', ''.join(chars_to_remove))
+                else:
+                    delete_table = None
+                normalized_config[normalized_name] = (chars_to_remove, delete_table)
+        
+        def clean_string_value(value: str, current_path: str) -> Tuple[str, int]:
+            """Clean a string value by removing global strings and field-specific characters"""
+            original_value = value
+            removed_count = 0
+            
+            # First, remove global strings (applies to all fields)
+            for string_to_remove in global_strings_to_remove:
+                if string_to_remove in value:
+                    occurrences = value.count(string_to_remove)
+                    value = value.replace(string_to_remove, '')
+                    removed_count += len(string_to_remove) * occurrences
+                    if occurrences > 0:
+                        logger.debug("Removed '%s' (%d occurrence(s)) from field '%s' in %s",
+                                 string_to_remove, occurrences, current_path, database_name)
+            
+            # Then, remove field-specific characters (if this field is configured)
+            normalized_key = _normalize_config_name(current_path.rpartition('.')[2])
+            if normalized_key in normalized_config:
+                chars_to_remove, delete_table = normalized_config[normalized_key]
+                if delete_table is not None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for char in dict.fromkeys(chars_to_remove):
+                            occurrences = value.count(char)
+                            if occurrences > 0:
+                                logger.debug("Removed '%s' (%d occurrence(s)) from field '%s' in %s",
+                                             char, occurrences, current_path, database_name)
+                    cleaned_value = value.translate(delete_table)
+                    removed_count += len(value) - len(cleaned_value)
+                    return cleaned_value, removed_count
+                
+                for char in chars_to_remove:
+                    if char in value:
+                        occurrences = value.count(char)
+                        value = value.replace(char, '')
+                        removed_count += occurrences
+                        if occurrences > 0:
+                            logger.debug("Removed '%s' (%d occurrence(s)) from field '%s' in %s",
+                                     char, occurrences, current_path, database_name)
+            
+            return value, removed_count
+        
+        return clean_string_value
+    
     def clean_special_characters(self, data: Any, database_name: str, field_path: str = "") -> Tuple[Any, int]:
         """
         Remove specific special characters and strings from field values based on database configuration
@@ -681,97 +1292,48 @@ class JSONParser:
             Tuple of (cleaned_data, characters_removed_count)
         """
         try:
-            import database_config
-            
-            # Get global string removal configuration (applies to all fields)
-            global_strings_to_remove = getattr(database_config, 'GLOBAL_STRING_REMOVAL', [])
-            
-            # Get database-specific character removal configuration
-            removal_config = getattr(database_config, 'SPECIAL_CHAR_REMOVAL', {})
-            
-            total_removed = 0
-            
-            # Normalize field names for comparison (lowercase, remove spaces/underscores/hyphens)
-            def normalize_name(name: str) -> str:
-                return name.lower().replace(' ', '').replace('_', '').replace('-', '').replace('.', '').replace(':', '')
+            clean_string_value = self._string_cleaner(database_name)
             
-            # Create normalized lookup dictionary for field-specific removal
-            normalized_config = {}
-            field_config = removal_config.get(database_name, {})
-            if field_config:
-                for field_name, chars_to_remove in field_config.items():
-                    normalized_name = normalize_name(field_name)
-                    normalized_config[normalized_name] = chars_to_remove
-            
-            def clean_string_value(value: str, current_path: str) -> Tuple[str, int]:
-                """Clean a string value by removing global strings and field-specific characters"""
-                original_value = value
-                removed_count = 0
-                
-                # First, remove global strings (applies to all fields)
-                for string_to_remove in global_strings_to_remove:
-                    if string_to_remove in value:
-                        occurrences = value.count(string_to_remove)
-                        value = value.replace(string_to_remove, '')
-                        removed_count += len(string_to_remove) * occurrences
-                        if occurrences > 0:
-                            logger.debug(f"Removed '{string_to_remove}' ({occurrences} occurrence(s)) from field '{current_path}' in {database_name}")
-                
-                # Then, remove field-specific characters (if this field is configured)
-                normalized_key = normalize_name(current_path.split('.')[-1] if '.' in current_path else current_path)
-                if normalized_key in normalized_config:
-                    chars_to_remove = normalized_config[normalized_key]
-                    for char in chars_to_remove:
-                        if char in value:
-                            occurrences = value.count(char)
-                            value = value.replace(char, '')
-                            removed_count += occurrences
-                            if occurrences > 0:
-                                logger.debug(f"Removed '{char}' ({occurrences} occurrence(s)) from field '{current_path}' in {database_name}")
+            def clean(root: Any, root_path: str) -> Tuple[Any, int]:
+                """
+                Clean a dict/list without recursion: each container gets an empty copy up front,
+                and (source, copy, path) entries on a stack fill the copies in
+                """
+                removed_total = 0
+                cleaned_root = {} if isinstance(root, dict) else [None] * len(root)
+                stack = [(root, cleaned_root, root_path)]
                 
-                return value, removed_count
-            
-            if isinstance(data, dict):
-                cleaned_data = {}
-                for key, value in data.items():
-                    current_path = f"{field_path}.{key}" if field_path else key
+                while stack:
+                    node, cleaned_node, node_path = stack.pop()
+                    in_dict = isinstance(node, dict)
                     
-                    if isinstance(value, str):
-                        # Clean string value
-                        cleaned_value, removed = clean_string_value(value, current_path)
-                        cleaned_data[key] = cleaned_value
-                        total_removed += removed
-                    elif isinstance(value, (dict, list)):
-                        # Recursively clean nested structures
-                        cleaned_value, removed = self.clean_special_characters(value, database_name, current_path)
-                        cleaned_data[key] = cleaned_value
-                        total_removed += removed
-                    else:
-                        cleaned_data[key] = value
+                    for key, value in (node.items() if in_dict else enumerate(node)):
+                        if in_dict:
+                            current_path = f"{node_path}.{key}" if node_path else key
+                        else:
+                            current_path = f"{node_path}[{key}]" if node_path else f"[{key}]"
+                        
+                        if isinstance(value, str):
+                            # Clean string value
+                            cleaned_node[key], removed = clean_string_value(value, current_path)
+                            removed_total += removed
+                        elif isinstance(value, dict):
+                            # Nested structures are filled in when their stack entry is popped
+                            cleaned_node[key] = cleaned_child = {}
+                            stack.append((value, cleaned_child, current_path))
+                        elif isinstance(value, list):
+                            cleaned_node[key] = cleaned_child = [None] * len(value)
+                            stack.append((value, cleaned_child, current_path))
+                        else:
+                            cleaned_node[key] = value
                 
-                return cleaned_data, total_removed
+                return cleaned_root, removed_total
             
-            elif isinstance(data, list):
-                cleaned_list = []
-                for idx, item in enumerate(data):
-                    current_path = f"{field_path}[{idx}]" if field_path else f"[{idx}]"
-                    if isinstance(item, str):
-                        # Clean string value in list
-                        cleaned_item, removed = clean_string_value(item, current_path)
-                        cleaned_list.append(cleaned_item)
-                        total_removed += removed
-                    elif isinstance(item, (dict, list)):
-                        cleaned_item, removed = self.clean_special_characters(item, database_name, current_path)
-                        cleaned_list.append(cleaned_item)
-                        total_removed += removed
-                    else:
-                        cleaned_list.append(item)
-                
-                return cleaned_list, total_removed
+            if isinstance(data, (dict, list)):
+                return clean(data, field_path)
             
-            else:
-                # For primitive types (int, float, bool, None), return as-is
-                return data, 0
+            # For primitive types (int, float, bool, None), return as-is
+            return data, 0
                 
         except Exception as e:
             logger.error(f"Error cleaning special characters: {str(e)}", exc_info=True)
@@ -808,9 +1370,7 @@ class JSONParser:
                 original_filename = os.path.basename(original_file_path)
                 output_path = os.path.join(output_dir, original_filename)
             
-            # Write cleaned JSON with proper indentation
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, indent=2, ensure_ascii=False)
+            self._write_json(output_path, cleaned_data)
             
             if overwrite_original:
                 logger.info(f"Saved cleaned JSON (overwritten original): {output_path}")
@@ -821,4 +1381,183 @@ class JSONParser:
         except Exception as e:
             logger.error(f"Failed to save cleaned JSON: {str(e)}", exc_info=True)
             return None
+    
+    def save_cleaned_batch(self, items: List[Tuple[str, Any]], output_dir: str) -> Dict[str, Optional[str]]:
+        """
+        Save several cleaned JSON documents into one directory
+        
+        The directory is created once for the whole batch; each file keeps its original name.
+        
+        Args:
+            items: List of (original_file_path, cleaned_data) pairs
+            output_dir: Directory to save the cleaned files in
+        
+        Returns:
+            Dictionary mapping original_file_path -> path to saved cleaned file (None if that file failed)
+        """
+        saved = {}
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to create output directory {output_dir}: {str(e)}")
+            return {original_file_path: None for original_file_path, _ in items}
+        
+        for original_file_path, cleaned_data in items:
+            output_path = os.path.join(output_dir, os.path.basename(original_file_path))
+            try:
+                self._write_json(output_path, cleaned_data)
+                saved[original_file_path] = output_path
+            except Exception as e:
+                logger.error(f"Failed to save cleaned JSON for {original_file_path}: {str(e)}")
+                saved[original_file_path] = None
+        
+        logger.info(f"Saved {sum(1 for path in saved.values() if path)} of {len(items)} cleaned JSON file(s) to: {output_dir}")
+        return saved
+    
+    def clean_and_save(self, input_path: str, output_path: str, database_name: str) -> Tuple[Optional[str], int]:
+        """
+        Clean special characters from a JSON file and write the result in one streaming pass
+        
+        Produces the same file as clean_special_characters followed by save_cleaned_json, but
+        when ijson is installed neither the parsed document nor its cleaned copy is held in
+        memory: parse events are cleaned and written out as they arrive. Output goes to a
+        temporary file that replaces output_path at the end, so output_path may be input_path.
+        Files ijson cannot read (non-UTF-8 encodings, NaN, trailing commas) fall back to the
+        in-memory path, which recovers them like load_json does.
+        
+        Args:
+            input_path: Path to the JSON file to clean
+            output_path: Path to write the cleaned JSON to
+            database_name: Name of the database for configuration lookup
+        
+        Returns:
+            Tuple of (path to saved cleaned file or None if failed, characters_removed_count)
+        """
+        if HAS_IJSON:
+            try:
+                removed = self._clean_and_save_streaming(input_path, output_path, database_name)
+                self.invalidate(output_path)
+                logger.info(f"Removed {removed} character(s) from {input_path}, saved to: {output_path}")
+                return output_path, removed
+            except ijson.JSONError as e:
+                logger.info(f"Streaming clean not possible for {input_path}, cleaning in memory")
+                logger.debug(f"ijson error for {input_path}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Failed to clean {input_path}: {str(e)}", exc_info=True)
+                return None, 0
+        
+        data = self.load_json(input_path)
+        if data is None:
+            return None, 0
+        cleaned_data, removed = self.clean_special_characters(data, database_name)
+        try:
+            self._write_json(output_path, cleaned_data)
+        except Exception as e:
+            logger.error(f"Failed to save cleaned JSON: {str(e)}", exc_info=True)
+            return None, removed
+        logger.info(f"Removed {removed} character(s) from {input_path}, saved to: {output_path}")
+        return output_path, removed
+    
+    def _clean_and_save_streaming(self, input_path: str, output_path: str, database_name: str) -> int:
+        """
+        Stream input_path through the string cleaner into output_path, indented like _dumps_indented
+        
+        Numbers are copied with their original text (ijson yields ints and Decimals). Raises
+        ijson.JSONError if the input cannot be streamed; output_path is then left untouched.
+        
+        Returns:
+            Number of characters removed
+        """
+        clean_string_value = self._string_cleaner(database_name)
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+        removed_total = 0
+        
+        try:
+            with open(input_path, 'rb') as src, \
+                    os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+                out = []
+                # One entry per open container: [is a dict, has children, path, current key or index]
+                stack = []
+                
+                for _prefix, event, value in ijson.parse(src):
+                    if event == 'map_key':
+                        container = stack[-1]
+                        out.append(',\n' if container[1] else '\n')
+                        container[1] = True
+                        container[3] = value
+                        out.append('  ' * len(stack))
+                        out.append(encode_basestring(value))
+                        out.append(': ')
+                        continue
+                    
+                    if event == 'end_map' or event == 'end_array':
+                        container = stack.pop()
+                        if container[1]:
+                            out.append('\n')
+                            out.append('  ' * len(stack))
+                        out.append('}' if event == 'end_map' else ']')
+                        continue
+                    
+                    # A value: list items get their separator and indent here (dict values
+                    # follow their key), and the path is built like clean_special_characters does
+                    current_path = None
+                    if stack:
+                        container = stack[-1]
+                        node_path = container[2]
+                        if container[0]:
+                            key = container[3]
+                            current_path = f"{node_path}.{key}" if node_path else key
+                        else:
+                            container[3] += 1
+                            out.append(',\n' if container[1] else '\n')
+                            container[1] = True
+                            out.append('  ' * len(stack))
+                            current_path = f"{node_path}[{container[3]}]" if node_path else f"[{container[3]}]"
+                    
+                    if event == 'string':
+                        # Strings are cleaned only inside containers, like clean_special_characters
+                        if current_path is not None:
+                            value, removed = clean_string_value(value, current_path)
+                            removed_total += removed
+                        out.append(encode_basestring(value))
+                    elif event == 'start_map':
+                        out.append('{')
+                        stack.append([True, False, current_path or "", None])
+                    elif event == 'start_array':
+                        out.append('[')
+                        stack.append([False, False, current_path or "", -1])
+                    elif event == 'boolean':
+                        out.append('true' if value else 'false')
+                    elif event == 'null':
+                        out.append('null')
+                    else:
+                        out.append(str(value))
+                    
+                    if len(out) >= 8192:
+                        dst.write(''.join(out))
+                        out.clear()
+                
+                dst.write(''.join(out))
+            
+            os.replace(temp_path, output_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        return removed_total
+    
+    def _write_json(self, output_path: str, data: Any):
+        """Write data as indented JSON and drop any cached parse of the file it replaces"""
+        content = _dumps_indented(data)
+        with open(output_path, 'wb') as f:
+            f.write(content)
+        self.invalidate(output_path)
+
 
+def _extract_fields_worker(file_path: str) -> Tuple[str, List[str]]:
+    """Process pool entry point for extract_fields_batch (each worker uses its own parser and caches)"""
+    return file_path, JSONParser().extract_fields(file_path)
@@ -4,10 +4,15 @@ Validates JSON files for syntax errors, schema compliance, and structural issues
 """
 
 import json
+import mmap
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 from datetime import datetime
+from itertools import islice
 
 # Try to import jsonschema for advanced validation (optional dependency)
 try:
@@ -18,9 +23,50 @@ except ImportError:
     HAS_JSONSCHEMA = False
     jsonschema = None  # type: ignore
 
+# Try to import orjson for faster parsing (optional dependency)
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+# Try to import ijson for streaming validation of very large files (optional dependency)
+try:
+    import ijson  # type: ignore
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None  # type: ignore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Files at least this large are validated from an ijson event stream instead of being read
+# and parsed into memory (when ijson is installed and no schema is given)
+STREAM_VALIDATE_MIN_BYTES = 50 * 1024 * 1024
+
+# Files at least this large are memory-mapped for parsing instead of read into a bytes object
+VALIDATE_MMAP_MIN_BYTES = 64 * 1024
+
+# Any non-whitespace byte (a file without one is reported as empty)
+_NON_BLANK_RE = re.compile(rb'\S')
+
+# Bytes the ASCII-only regex does not treat as whitespace but that may start a character
+# str.strip() removes (\x1c-\x1f, and UTF-8 sequences such as NBSP or U+3000)
+_MAYBE_BLANK_BYTES = frozenset(range(0x1c, 0x20)) | frozenset(range(0x80, 0x100))
+
+# Comment markers ('//' or '/*'), found in one pass over the raw bytes instead of two
+_COMMENT_MARKER_RE = re.compile(rb'//|/\*')
+
+# The single-quote check looks at the first 100 complete lines within this many leading bytes
+COMMON_ISSUES_HEAD_BYTES = 64 * 1024
+
+# validate_batch only starts worker processes for at least this many files totalling at
+# least this many bytes; below that, pool start-up costs more than it saves
+BATCH_PARALLEL_MIN_FILES = 4
+BATCH_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
 
 class JSONValidator:
     """
@@ -31,18 +77,39 @@ class JSONValidator:
     - Data type validation
     """
     
+    __slots__ = ('validation_results', 'error_count', 'warning_count', 'default_schema', '_schema_validator')
+    
     def __init__(self):
         self.validation_results = []
         self.error_count = 0
         self.warning_count = 0
+        # Schema used when validate_file/validate_batch are called without one (see set_schema)
+        self.default_schema = None
+        self._schema_validator = None
+    
+    def set_schema(self, schema: Optional[Dict]):
+        """
+        Set the schema used when no schema is passed to validate_file or validate_batch
+        
+        The schema is checked and its validator built once here, so validating files against it
+        does no per-file schema work. An invalid schema is still stored: each file then reports
+        the schema error.
+        
+        Args:
+            schema: JSON schema (None clears it)
+        """
+        self.default_schema = schema
+        self._schema_validator = compile_schema(schema)
     
-    def validate_file(self, file_path: str, schema: Optional[Dict] = None) -> Dict[str, Any]:
+    def validate_file(self, file_path: str, schema: Optional[Dict] = None,
+                      schema_validator: Any = None) -> Dict[str, Any]:
         """
         Validate a JSON file for syntax and optional schema compliance
         
         Args:
             file_path: Path to JSON file
-            schema: Optional JSON schema to validate against
+            schema: Optional JSON schema to validate against (default: the one from set_schema)
+            schema_validator: Optional validator for schema from compile_schema, reused across files
         
         Returns:
             Dictionary containing validation results:
@@ -62,6 +129,11 @@ class JSONValidator:
             'info': {}
         }
         
+        if schema is None and self.default_schema is not None:
+            schema = self.default_schema
+            if schema_validator is None:
+                schema_validator = self._schema_validator
+        
         try:
             # Check if file exists
             if not os.path.exists(file_path):
@@ -78,57 +150,21 @@ class JSONValidator:
             if file_size > 100 * 1024 * 1024:  # 100MB
                 result['warnings'].append(f"Large file size: {result['info']['file_size_mb']} MB")
             
-            # Read and parse JSON
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for empty file
-            if not content.strip():
-                result['valid'] = False
-                result['errors'].append("File is empty")
-                return result
-            
-            # Validate JSON syntax
-            try:
-                data = json.loads(content)
-                result['info']['syntax'] = 'valid'
-            except json.JSONDecodeError as e:
-                result['valid'] = False
-                result['errors'].append(f"JSON syntax error at line {e.lineno}, column {e.colno}: {e.msg}")
-                result['info']['syntax'] = 'invalid'
-                
-                # Try to provide helpful suggestions
-                suggestions = self._get_syntax_suggestions(content, e)
-                if suggestions:
-                    result['info']['suggestions'] = suggestions
-                
+            # Huge files are checked from the event stream, without holding the text or the
+            # parsed tree in memory. Schema validation needs the data, so it keeps the full parse.
+            if HAS_IJSON and not schema and file_size >= STREAM_VALIDATE_MIN_BYTES:
+                self._validate_streaming(file_path, result)
                 return result
             
-            # Validate structure
-            structure_validation = self._validate_structure(data)
-            result['info'].update(structure_validation)
-            
-            if structure_validation.get('issues'):
-                result['warnings'].extend(structure_validation['issues'])
-            
-            # Validate data types
-            type_validation = self._validate_data_types(data)
-            if type_validation.get('issues'):
-                result['warnings'].extend(type_validation['issues'])
-            
-            # Schema validation if provided
-            if schema:
-                schema_validation = self._validate_schema(data, schema)
-                result['info']['schema_validation'] = schema_validation
-                
-                if not schema_validation['valid']:
-                    result['valid'] = False
-                    result['errors'].extend(schema_validation['errors'])
-            
-            # Check for common issues
-            common_issues = self._check_common_issues(data, content)
-            if common_issues:
-                result['warnings'].extend(common_issues)
+            # Read raw bytes: orjson parses UTF-8 bytes directly, so the text is only
+            # decoded when the stdlib parser has to take over. Larger files are memory-mapped
+            # instead of copied into a bytes object.
+            with open(file_path, 'rb') as f:
+                if HAS_ORJSON and file_size >= VALIDATE_MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        self._validate_content(content, result, schema, schema_validator)
+                else:
+                    self._validate_content(f.read(), result, schema, schema_validator)
             
         except UnicodeDecodeError as e:
             result['valid'] = False
@@ -140,16 +176,277 @@ class JSONValidator:
         
         return result
     
-    def validate_batch(self, file_paths: List[str], schema: Optional[Dict] = None) -> Dict[str, Any]:
+    def _validate_content(self, content: Any, result: Dict[str, Any], schema: Optional[Dict],
+                          schema_validator: Any):
         """
-        Validate multiple JSON files
+        Validate the raw content of a file and fill in result (see validate_file)
         
         Args:
-            file_paths: List of file paths to validate
+            content: File content as bytes, or a memory map of the file
+            result: Result dictionary from validate_file, filled in place
             schema: Optional JSON schema to validate against
+            schema_validator: Optional validator for schema from compile_schema
+        """
+        # Check for empty file (the text is only decoded when the first non-blank byte may
+        # still be Unicode whitespace)
+        match = _NON_BLANK_RE.search(content)
+        if match is None or (content[match.start()] in _MAYBE_BLANK_BYTES
+                             and not str(content, 'utf-8').strip()):
+            result['valid'] = False
+            result['errors'].append("File is empty")
+            return
+        
+        # Validate JSON syntax
+        try:
+            data = self._parse(content)
+            result['info']['syntax'] = 'valid'
+        except json.JSONDecodeError as e:
+            result['valid'] = False
+            result['errors'].append(f"JSON syntax error at line {e.lineno}, column {e.colno}: {e.msg}")
+            result['info']['syntax'] = 'invalid'
+            
+            # Try to provide helpful suggestions
+            suggestions = self._get_syntax_suggestions(str(content, 'utf-8'), e)
+            if suggestions:
+                result['info']['suggestions'] = suggestions
+            
+            return
+        
+        # Validate structure
+        structure_validation = self._validate_structure(data)
+        result['info'].update(structure_validation)
+        
+        if structure_validation.get('issues'):
+            result['warnings'].extend(structure_validation['issues'])
+        
+        # Validate data types
+        type_validation = self._validate_data_types(data)
+        if type_validation.get('issues'):
+            result['warnings'].extend(type_validation['issues'])
+        
+        # Schema validation if provided
+        if schema:
+            schema_validation = self._validate_schema(data, schema, schema_validator)
+            result['info']['schema_validation'] = schema_validation
+            
+            if not schema_validation['valid']:
+                result['valid'] = False
+                result['errors'].extend(schema_validation['errors'])
+        
+        # Check for common issues
+        common_issues = self._check_common_issues(data, content)
+        if common_issues:
+            result['warnings'].extend(common_issues)
+    
+    @staticmethod
+    def _parse(content: Any) -> Any:
+        """
+        Parse UTF-8 encoded JSON (bytes or a memory map), with orjson when available
+        
+        Anything orjson rejects is decoded and re-parsed with the stdlib json module, which
+        decides the outcome: invalid UTF-8 raises UnicodeDecodeError, NaN/Infinity are accepted
+        like before, and its JSONDecodeError carries the line/column used in error messages
+        and suggestions.
+        """
+        if HAS_ORJSON:
+            try:
+                if isinstance(content, bytes):
+                    return orjson.loads(content)
+                # A memory map is handed over as a memoryview, released before the map closes
+                with memoryview(content) as view:
+                    return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(str(content, 'utf-8'))
+    
+    def _validate_streaming(self, file_path: str, result: Dict[str, Any]):
+        """
+        Validate a large file from its ijson event stream
+        
+        Produces the same syntax, structure, data type and common-issue results as the
+        in-memory path, but only the stack of open containers (and, for a root array of
+        objects, two key sets) is held at once. ijson errors carry no line/column, so
+        syntax errors are reported without them and without suggestions.
+        
+        Args:
+            file_path: Path to JSON file
+            result: Result dictionary from validate_file, filled in place
+        """
+        info = result['info']
+        type_issues = []
+        
+        # One entry per open container: [is a dict, current key or index]
+        containers = []
+        root_type = None
+        max_depth = 0
+        root_fields = []
+        array_length = 0
+        first_type = None
+        first_keys = None
+        element_keys = None
+        inconsistent = False
+        inconsistent_keys = False
+        
+        try:
+            with open(file_path, 'rb') as f:
+                for _prefix, event, value in ijson.parse(f, use_float=True):
+                    if event == 'map_key':
+                        containers[-1][1] = value
+                        depth = len(containers)
+                        if depth == 1:
+                            root_fields.append(value)
+                        elif depth == 2 and element_keys is not None and root_type == 'list':
+                            element_keys.add(value)
+                        continue
+                    
+                    if event == 'end_map' or event == 'end_array':
+                        containers.pop()
+                        # A finished object in a root array: compare its keys with the first one's
+                        if element_keys is not None and len(containers) == 1 and event == 'end_map':
+                            if first_keys is None:
+                                first_keys = element_keys
+                            elif not inconsistent_keys and element_keys != first_keys:
+                                inconsistent_keys = True
+                            element_keys = None
+                        continue
+                    
+                    # Any other event starts a value nested inside every open container
+                    depth = len(containers)
+                    if depth > max_depth:
+                        max_depth = depth
+                    if event == 'start_map':
+                        type_name = 'dict'
+                    elif event == 'start_array':
+                        type_name = 'list'
+                    else:
+                        type_name = type(value).__name__
+                    
+                    if depth == 0:
+                        root_type = type_name
+                    else:
+                        parent = containers[-1]
+                        if not parent[0]:
+                            parent[1] += 1
+                        
+                        if depth == 1 and root_type == 'list':
+                            array_length += 1
+                            if first_type is None:
+                                first_type = type_name
+                            elif type_name != first_type:
+                                inconsistent = True
+                            # Key sets are compared only when the first element is an object
+                            if event == 'start_map' and (array_length == 1 or first_keys is not None):
+                                element_keys = set()
+                        
+                        # Check for empty strings (may indicate data quality issues)
+                        if event == 'string' and parent[0] and (not value or value.isspace()):
+                            path = "root" + "".join(
+                                f".{key}" if in_dict else f"[{key}]" for in_dict, key in containers
+                            )
+                            type_issues.append(f"Empty string at {path}")
+                    
+                    if event == 'start_map':
+                        containers.append([True, None])
+                    elif event == 'start_array':
+                        containers.append([False, -1])
+        except ijson.JSONError as e:
+            result['valid'] = False
+            if root_type is None and self._is_blank_file(file_path):
+                result['errors'].append("File is empty")
+            else:
+                result['errors'].append(f"JSON syntax error: {e}")
+                info['syntax'] = 'invalid'
+            return
+        
+        info['syntax'] = 'valid'
+        
+        # Validate structure
+        structure_issues = []
+        info['root_type'] = root_type
+        info['issues'] = structure_issues
+        if root_type == 'dict':
+            info['field_count'] = len(root_fields)
+            info['fields'] = root_fields
+            if not root_fields:
+                structure_issues.append("Root object is empty")
+            info['max_nesting_depth'] = max_depth
+            if max_depth > 10:
+                structure_issues.append(f"Deep nesting detected: {max_depth} levels")
+        elif root_type == 'list':
+            info['array_length'] = array_length
+            if array_length == 0:
+                structure_issues.append("Root array is empty")
+            else:
+                info['array_element_type'] = first_type
+                if inconsistent:
+                    structure_issues.append("Array contains mixed element types")
+                if inconsistent_keys:
+                    structure_issues.append("Array objects have inconsistent field sets")
+        
+        result['warnings'].extend(structure_issues)
+        result['warnings'].extend(type_issues)
+        
+        # Check for common issues
+        has_comment_markers, head_lines = self._scan_raw_text(file_path)
+        result['warnings'].extend(self._common_issues(has_comment_markers, head_lines))
+    
+    @staticmethod
+    def _is_blank_file(file_path: str, chunk_size: int = 1024 * 1024) -> bool:
+        """Return True if the file holds nothing but whitespace (Unicode whitespace included)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(chunk_size), ''):
+                if chunk.strip():
+                    return False
+        return True
+    
+    @staticmethod
+    def _scan_raw_text(file_path: str, chunk_size: int = 1024 * 1024) -> Tuple[bool, List[str]]:
+        """
+        Read a file in chunks for the common-issue checks
+        
+        Returns:
+            Tuple of (whether '//' or '/*' occurs anywhere, the first 100 lines)
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(COMMON_ISSUES_HEAD_BYTES)
+            head_lines = JSONValidator._head_lines(head, at_eof=len(head) < COMMON_ISSUES_HEAD_BYTES)
+            f.seek(0)
+            
+            # Keep the last byte of each chunk so markers split across chunks are found
+            tail = b''
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                window = tail + chunk
+                if _COMMENT_MARKER_RE.search(window):
+                    return True, head_lines
+                tail = chunk[-1:]
+        return False, head_lines
+    
+    @staticmethod
+    def _total_size(file_paths: List[str]) -> int:
+        """Return the combined size of the given files (missing files count as 0 bytes)"""
+        total = 0
+        for file_path in file_paths:
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                pass
+        return total
+    
+    def validate_batch(self, file_paths: List[str], schema: Optional[Dict] = None,
+                       max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Validate multiple JSON files, in worker processes for larger batches
+        
+        Batches of fewer than BATCH_PARALLEL_MIN_FILES files or less than BATCH_PARALLEL_MIN_BYTES
+        in total, and any batch in a frozen executable, are validated in-process.
+        
+        Args:
+            file_paths: List of file paths to validate
+            schema: Optional JSON schema to validate against (default: the one from set_schema)
+            max_workers: Maximum number of worker processes (default: one per CPU, capped at file count)
         
         Returns:
-            Dictionary containing batch validation results
+            Dictionary containing batch validation results (details in the order of file_paths)
         """
         results = {
             'total_files': len(file_paths),
@@ -159,8 +456,35 @@ class JSONValidator:
             'details': []
         }
         
-        for file_path in file_paths:
-            validation_result = self.validate_file(file_path, schema)
+        if schema is None:
+            schema = self.default_schema
+        
+        details = []
+        # Workers of a frozen executable re-run its entry point unless that entry point calls
+        # multiprocessing.freeze_support() first, which this module cannot guarantee
+        if (len(file_paths) >= BATCH_PARALLEL_MIN_FILES and not getattr(sys, 'frozen', False)
+                and self._total_size(file_paths) >= BATCH_PARALLEL_MIN_BYTES):
+            workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+            chunksize = max(1, min(8, len(file_paths) // (workers * 4)))
+            try:
+                # Each worker compiles the schema once, in its initializer
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_validate_worker,
+                                         initargs=(schema,)) as executor:
+                    details.extend(executor.map(_validate_file_worker, file_paths,
+                                                [schema] * len(file_paths), chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Parallel validation failed, continuing sequentially: {str(e)}")
+        
+        # Small batches, and whatever a failed pool left unfinished, are validated here
+        if len(details) < len(file_paths):
+            if schema is self.default_schema:
+                schema_validator = self._schema_validator
+            else:
+                schema_validator = compile_schema(schema)
+            for file_path in file_paths[len(details):]:
+                details.append(self.validate_file(file_path, schema, schema_validator))
+        
+        for validation_result in details:
             results['details'].append(validation_result)
             
             if validation_result['valid']:
@@ -201,36 +525,35 @@ class JSONValidator:
             if len(data) == 0:
                 info['issues'].append("Root array is empty")
             else:
-                # Check array element consistency
-                if len(data) > 0:
-                    first_type = type(data[0]).__name__
-                    info['array_element_type'] = first_type
-                    
-                    # Check if all elements have same type
-                    inconsistent = False
-                    for item in data[1:]:
-                        if type(item).__name__ != first_type:
-                            inconsistent = True
-                            break
-                    
-                    if inconsistent:
-                        info['issues'].append("Array contains mixed element types")
-                    
-                    # If array of objects, check for consistent fields
-                    if isinstance(data[0], dict) and len(data) > 1:
-                        first_keys = set(data[0].keys())
-                        inconsistent_keys = False
-                        for item in data[1:]:
-                            if isinstance(item, dict) and set(item.keys()) != first_keys:
-                                inconsistent_keys = True
-                                break
-                        
-                        if inconsistent_keys:
-                            info['issues'].append("Array objects have inconsistent field sets")
+                # Check array element consistency: element types and (for arrays of objects)
+                # field sets, both in one pass that stops once every possible issue is found
+                first_item = data[0]
+                first_type = type(first_item)
+                info['array_element_type'] = first_type.__name__
+                first_keys = first_item.keys() if isinstance(first_item, dict) else None
+                
+                inconsistent = False
+                inconsistent_keys = False
+                for item in islice(data, 1, None):
+                    if not inconsistent and type(item) is not first_type:
+                        inconsistent = True
+                    # dict key views compare as sets, without building a set per item
+                    if (first_keys is not None and not inconsistent_keys
+                            and isinstance(item, dict) and item.keys() != first_keys):
+                        inconsistent_keys = True
+                    if inconsistent and (inconsistent_keys or first_keys is None):
+                        break
+                
+                if inconsistent:
+                    info['issues'].append("Array contains mixed element types")
+                
+                if inconsistent_keys:
+                    info['issues'].append("Array objects have inconsistent field sets")
         
         return info
     
-    def _validate_data_types(self, data: Any, path: str = "root", check_nulls: bool = False) -> Dict[str, Any]:
+    def _validate_data_types(self, data: Any, path: str = "root", check_nulls: bool = False,
+                             check_empty_strings: bool = True) -> Dict[str, Any]:
         """
         Validate data types and check for potential issues
         
@@ -238,41 +561,59 @@ class JSONValidator:
             data: Data to validate
             path: Current path in data structure
             check_nulls: If True, report null values (default: False, as nulls are valid JSON)
+            check_empty_strings: If True, report empty or whitespace-only strings (default: True)
         """
         issues = []
-        
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}"
-                
-                # Only check for null values if explicitly requested (nulls are valid JSON)
-                if check_nulls and value is None:
-                    issues.append(f"Null value at {current_path}")
-                
-                # Check for empty strings (may indicate data quality issues)
-                elif isinstance(value, str) and value.strip() == "":
-                    issues.append(f"Empty string at {current_path}")
+        # Nothing to report, so skip the walk entirely
+        if not isinstance(data, (dict, list)) or not (check_nulls or check_empty_strings):
+            return {'issues': issues}
+        
+        # Each entry: (is a dict, path of the container, iterator over its remaining items).
+        # Descending into a nested container suspends the parent's iterator, so issues are
+        # reported in document order without recursion.
+        stack = [(isinstance(data, dict), path, iter(data.items()) if isinstance(data, dict) else enumerate(data))]
+        
+        while stack:
+            in_dict, container_path, items = stack[-1]
+            for key, value in items:
+                if in_dict:
+                    current_path = f"{container_path}.{key}"
+                    
+                    # Only check for null values if explicitly requested (nulls are valid JSON)
+                    if check_nulls and value is None:
+                        issues.append(f"Null value at {current_path}")
+                        continue
+                    
+                    # Check for empty strings (may indicate data quality issues)
+                    if type(value) is str:
+                        if check_empty_strings and (not value or value.isspace()):
+                            issues.append(f"Empty string at {current_path}")
+                        continue
+                else:
+                    current_path = f"{container_path}[{key}]"
                 
-                # Recursively check nested structures
-                elif isinstance(value, (dict, list)):
-                    nested_validation = self._validate_data_types(value, current_path, check_nulls)
-                    if nested_validation.get('issues'):
-                        issues.extend(nested_validation['issues'])
-        
-        elif isinstance(data, list):
-            for idx, item in enumerate(data):
-                current_path = f"{path}[{idx}]"
-                if isinstance(item, (dict, list)):
-                    nested_validation = self._validate_data_types(item, current_path, check_nulls)
-                    if nested_validation.get('issues'):
-                        issues.extend(nested_validation['issues'])
+                # Descend into nested structures (exact type checks: parsed JSON has no subclasses)
+                value_type = type(value)
+                if value_type is dict:
+                    stack.append((True, current_path, iter(value.items())))
+                    break
+                if value_type is list:
+                    stack.append((False, current_path, enumerate(value)))
+                    break
+            else:
+                stack.pop()
         
         return {'issues': issues}
     
-    def _validate_schema(self, data: Any, schema: Dict) -> Dict[str, Any]:
+    def _validate_schema(self, data: Any, schema: Dict, schema_validator: Any = None) -> Dict[str, Any]:
         """
         Validate data against a JSON schema
         Uses jsonschema library if available, otherwise falls back to basic validation
+        
+        Args:
+            data: Data to validate
+            schema: JSON schema
+            schema_validator: Validator already built for schema by compile_schema (built here if None)
         """
         result = {
             'valid': True,
@@ -283,14 +624,17 @@ class JSONValidator:
             # Use jsonschema library if available (more comprehensive)
             if HAS_JSONSCHEMA:
                 try:
-                    jsonschema.validate(instance=data, schema=schema)
-                    result['valid'] = True
-                except jsonschema.ValidationError as e:
-                    result['valid'] = False
-                    result['errors'].append(f"Schema validation error: {e.message}")
-                    if e.path:
-                        path_str = '.'.join(str(p) for p in e.path)
-                        result['errors'].append(f"  at path: {path_str}")
+                    if schema_validator is None:
+                        validator_class = jsonschema.validators.validator_for(schema)
+                        validator_class.check_schema(schema)
+                        schema_validator = validator_class(schema)
+                    # Report every schema violation, each followed by its location
+                    for e in schema_validator.iter_errors(data):
+                        result['valid'] = False
+                        result['errors'].append(f"Schema validation error: {e.message}")
+                        if e.path:
+                            path_str = '.'.join(str(p) for p in e.path)
+                            result['errors'].append(f"  at path: {path_str}")
                 except jsonschema.SchemaError as e:
                     result['valid'] = False
                     result['errors'].append(f"Invalid schema: {e.message}")
@@ -344,29 +688,68 @@ class JSONValidator:
         return True
     
     def _get_max_depth(self, data: Any, current_depth: int = 0) -> int:
-        """Calculate maximum nesting depth"""
-        if isinstance(data, dict):
-            if not data:
-                return current_depth
-            return max(self._get_max_depth(v, current_depth + 1) for v in data.values())
-        elif isinstance(data, list):
-            if not data:
-                return current_depth
-            return max(self._get_max_depth(item, current_depth + 1) for item in data)
-        else:
-            return current_depth
+        """Calculate maximum nesting depth (iteratively, so deeply nested data cannot hit the recursion limit)"""
+        max_depth = current_depth
+        stack = [(data, current_depth)]
+        
+        while stack:
+            node, depth = stack.pop()
+            node_type = type(node)
+            if node_type is dict:
+                children = node.values()
+            elif node_type is list:
+                children = node
+            else:
+                continue
+            
+            # A non-empty container puts its children (scalars included) one level deeper
+            if children:
+                child_depth = depth + 1
+                if child_depth > max_depth:
+                    max_depth = child_depth
+                stack.extend((child, child_depth) for child in children if type(child) is dict or type(child) is list)
+        
+        return max_depth
+    
+    def _check_common_issues(self, data: Any, content: bytes) -> List[str]:
+        """Check for common JSON issues that indicate invalid JSON (content is the raw file bytes)"""
+        has_comment_markers = _COMMENT_MARKER_RE.search(content) is not None
+        head_lines = self._head_lines(content[:COMMON_ISSUES_HEAD_BYTES],
+                                      at_eof=len(content) <= COMMON_ISSUES_HEAD_BYTES)
+        return self._common_issues(has_comment_markers, head_lines)
+    
+    @staticmethod
+    def _head_lines(head: bytes, at_eof: bool) -> List[str]:
+        """
+        Split the leading bytes of a file into its first (up to 100) lines
+        
+        Args:
+            head: The first COMMON_ISSUES_HEAD_BYTES bytes of the file (or all of it)
+            at_eof: Whether head is the whole file
+        
+        A line cut off at the end of head is dropped unless head is the whole file, so the
+        quote check never sees a truncated line or a multi-byte character split in two.
+        """
+        if not at_eof:
+            head = head[:head.rfind(b'\n') + 1]
+        return head.decode('utf-8', errors='replace').split('\n', 100)[:100]
     
-    def _check_common_issues(self, data: Any, content: str) -> List[str]:
-        """Check for common JSON issues that indicate invalid JSON"""
+    def _common_issues(self, has_comment_markers: bool, head_lines: List[str]) -> List[str]:
+        """
+        Build the common-issue warnings
+        
+        Args:
+            has_comment_markers: Whether '//' or '/*' occurs anywhere in the file
+            head_lines: The first (up to 100) lines of the file
+        """
         issues = []
         
         # Check for comments (not valid in JSON)
-        if '//' in content or '/*' in content:
+        if has_comment_markers:
             issues.append("File may contain comments (not valid in JSON)")
         
         # Check for single quotes (JSON requires double quotes)
-        lines = content.split('\n')
-        for i, line in enumerate(lines[:100], 1):  # Check first 100 lines
+        for i, line in enumerate(head_lines, 1):  # Check first 100 lines
             if "'" in line and '"' not in line:
                 issues.append(f"Possible single quotes on line {i} (JSON requires double quotes)")
                 break
@@ -380,23 +763,24 @@ class JSONValidator:
         """Provide helpful suggestions based on syntax error"""
         suggestions = []
         
-        # Get the problematic line
-        lines = content.split('\n')
-        if 0 <= error.lineno - 1 < len(lines):
-            problem_line = lines[error.lineno - 1]
-            
-            # Check for common issues
-            if 'Expecting' in error.msg:
-                if 'property name' in error.msg:
-                    suggestions.append("Check for missing quotes around property names")
-                elif 'value' in error.msg:
-                    suggestions.append("Check for trailing commas or missing values")
-            
-            if 'Unterminated string' in error.msg:
-                suggestions.append("Check for unclosed string quotes")
-            
-            if problem_line.strip().endswith(','):
-                suggestions.append("Check for trailing comma before closing bracket")
+        # Get the problematic line: the one holding the error position, sliced out
+        # without splitting the whole content into lines
+        line_start = content.rfind('\n', 0, error.pos) + 1
+        line_end = content.find('\n', error.pos)
+        problem_line = content[line_start:line_end if line_end != -1 else len(content)]
+        
+        # Check for common issues
+        if 'Expecting' in error.msg:
+            if 'property name' in error.msg:
+                suggestions.append("Check for missing quotes around property names")
+            elif 'value' in error.msg:
+                suggestions.append("Check for trailing commas or missing values")
+        
+        if 'Unterminated string' in error.msg:
+            suggestions.append("Check for unclosed string quotes")
+        
+        if problem_line.strip().endswith(','):
+            suggestions.append("Check for trailing comma before closing bracket")
         
         return suggestions
     
@@ -427,39 +811,46 @@ class JSONValidator:
         report_lines.append(f"Files with Warnings: {validation_results['files_with_warnings']}")
         report_lines.append("")
         
+        # Sort every file into the invalid / warnings / valid sections in one pass,
+        # computing each file name once
+        invalid_lines = []
+        warning_lines = []
+        valid_lines = []
+        for detail in validation_results['details']:
+            file_path = detail['file']
+            file_name = os.path.basename(file_path)
+            if not detail['valid']:
+                invalid_lines.append(f"\nFile: {file_name}")
+                invalid_lines.append(f"  Path: {file_path}")
+                if detail['errors']:
+                    invalid_lines.append("  Errors:")
+                    invalid_lines.extend(f"    - {error}" for error in detail['errors'])
+            if detail['warnings']:
+                warning_lines.append(f"\nFile: {file_name}")
+                warning_lines.append(f"  Path: {file_path}")
+                warning_lines.append("  Warnings:")
+                warning_lines.extend(f"    - {warning}" for warning in detail['warnings'])
+            elif detail['valid']:
+                valid_lines.append(f"  ✓ {file_name}")
+        
         # Details for invalid files
         if validation_results['invalid_files'] > 0:
             report_lines.append("INVALID FILES")
             report_lines.append("-" * 80)
-            for detail in validation_results['details']:
-                if not detail['valid']:
-                    report_lines.append(f"\nFile: {os.path.basename(detail['file'])}")
-                    report_lines.append(f"  Path: {detail['file']}")
-                    if detail['errors']:
-                        report_lines.append("  Errors:")
-                        for error in detail['errors']:
-                            report_lines.append(f"    - {error}")
+            report_lines.extend(invalid_lines)
             report_lines.append("")
         
         # Files with warnings
         if validation_results['files_with_warnings'] > 0:
             report_lines.append("FILES WITH WARNINGS")
             report_lines.append("-" * 80)
-            for detail in validation_results['details']:
-                if detail['warnings']:
-                    report_lines.append(f"\nFile: {os.path.basename(detail['file'])}")
-                    report_lines.append(f"  Path: {detail['file']}")
-                    report_lines.append("  Warnings:")
-                    for warning in detail['warnings']:
-                        report_lines.append(f"    - {warning}")
+            report_lines.extend(warning_lines)
             report_lines.append("")
         
         # Valid files summary
         report_lines.append("VALID FILES")
         report_lines.append("-" * 80)
-        for detail in validation_results['details']:
-            if detail['valid'] and not detail['warnings']:
-                report_lines.append(f"  ✓ {os.path.basename(detail['file'])}")
+        report_lines.extend(valid_lines)
         
         report_lines.append("")
         report_lines.append("=" * 80)
@@ -477,3 +868,38 @@ class JSONValidator:
         
         return report_text
 
+
+def compile_schema(schema: Optional[Dict]) -> Any:
+    """
+    Check a JSON schema and build a jsonschema validator for it, to reuse across files
+    
+    Args:
+        schema: JSON schema (or None)
+    
+    Returns:
+        Validator instance, or None if there is no schema, jsonschema is not installed, or
+        the schema is invalid (validate_file then reports the schema error itself)
+    """
+    if not schema or not HAS_JSONSCHEMA:
+        return None
+    try:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
+    except jsonschema.SchemaError:
+        return None
+
+
+# Schema validator built once per worker process by _init_validate_worker
+_worker_schema_validator = None
+
+
+def _init_validate_worker(schema: Optional[Dict]):
+    """Process pool initializer for validate_batch: compile the batch schema once per worker"""
+    global _worker_schema_validator
+    _worker_schema_validator = compile_schema(schema)
+
+
+def _validate_file_worker(file_path: str, schema: Optional[Dict]) -> Dict[str, Any]:
+    """Process pool entry point for validate_batch (each worker uses its own validator)"""
+    return JSONValidator().validate_file(file_path, schema, _worker_schema_validator)
@@ -0,0 +1,93 @@
+"""
+Test script for JSON Parser
+Checks that large integers survive parsing, cleaning and saving unchanged
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from json_parser import JSONParser, _loads
+
+# Outside the signed and unsigned 64-bit ranges that orjson can hold as integers
+BIG_INTEGERS = [2 ** 64, -(2 ** 63) - 1, 123456789012345678901234567890]
+
+
+def _big_int_document() -> dict:
+    """Build a small document that mixes big integers with ordinary values"""
+    return {
+        "ids": BIG_INTEGERS,
+        "record": {"account": BIG_INTEGERS[2], "name": "Alice", "score": 1.5, "count": 7},
+    }
+
+
+def test_loads_keeps_big_integers():
+    """Integers outside the 64-bit range are parsed exactly, not as floats"""
+    document = _big_int_document()
+    data = _loads(json.dumps(document))
+    assert data == document
+    assert all(type(value) is int for value in data["ids"])
+
+
+def test_clean_and_save_keeps_big_integers():
+    """Cleaning and saving a parsed document writes its big integers back unchanged"""
+    parser = JSONParser()
+    temp_dir = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(temp_dir, "big_ints.json")
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(_big_int_document(), f)
+        
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = _loads(f.read())
+        cleaned, _ = parser.clean_special_characters(data, "TestDatabase")
+        assert parser.save_cleaned_json(file_path, cleaned, overwrite_original=True) == file_path
+        
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert json.load(f) == _big_int_document()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_load_clean_save_round_trip_keeps_big_integers():
+    """load_json -> clean_special_characters -> save_cleaned_json leaves big integers unchanged"""
+    parser = JSONParser()
+    temp_dir = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(temp_dir, "big_ints.json")
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(_big_int_document(), f, indent=2)
+        
+        data = parser.load_json(file_path)
+        assert data == _big_int_document()
+        cleaned, _ = parser.clean_special_characters(data, "TestDatabase")
+        assert parser.save_cleaned_json(file_path, cleaned, overwrite_original=True) == file_path
+        
+        with open(file_path, "r", encoding="utf-8") as f:
+            assert json.load(f) == _big_int_document()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_loads_keeps_big_integers,
+        test_clean_and_save_keeps_big_integers,
+        test_load_clean_save_round_trip_keeps_big_integers,
+    ]
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"PASS  {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"FAIL  {test.__name__}: {e}")
+    print(f"\n{len(tests) - failures}/{len(tests)} tests passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,72 @@ Test script for JSON Validator
 Demonstrates how to use the JSON validator programmatically
 """
 
+import io
 import os
 import json
-from json_validator import JSONValidator
+import shutil
+import sys
+from functools import lru_cache
+from itertools import islice
+from json_validator import JSONValidator, compile_schema
 
+# Fixtures and the generated report both live here, so cleanup is a single rmtree
+TEST_DIR = "test_json_files"
+REPORT_PATH = os.path.join(TEST_DIR, "test_validation_report.txt")
 
-def create_test_files():
-    """Create test JSON files for validation"""
-    test_dir = "test_json_files"
-    if not os.path.exists(test_dir):
-        os.makedirs(test_dir)
+# Try to import orjson for faster fixture serialization (optional dependency)
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None  # type: ignore
+
+
+def _dumps(data, indent: bool = True) -> bytes:
+    """Serialize a fixture to UTF-8 JSON bytes (2-space indented unless indent is False)"""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _open_fixture(path: str):
+    """Open a fixture file for binary writing through a 64KB buffer"""
+    return open(path, "wb", buffering=64 * 1024)
+
+
+def _write_fixture(path: str, content: bytes) -> bool:
+    """
+    Write a fixture file unless it already holds exactly this content
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.path.getsize(path) == len(content):
+            with open(path, "rb") as f:
+                if f.read() == content:
+                    return False
+    except OSError:
+        pass  # Missing or unreadable: write it
     
+    with _open_fixture(path) as f:
+        f.write(content)
+    return True
+
+
+def _make_nested(depth: int = 11) -> dict:
+    """Build {"level1": {"level2": ... {"level<depth>": {"data": "very deep"}}}}, innermost first"""
+    nested = {"data": "very deep"}
+    for level in range(depth, 0, -1):
+        nested = {f"level{level}": nested}
+    return nested
+
+
+# JSON fixtures written by create_test_files: (file name, payload, indented)
+_FIXTURES = (
     # Valid JSON file
-    valid_data = {
+    ("valid.json", {
         "name": "John Doe",
         "age": 30,
         "email": "john@example.com",
@@ -25,180 +78,166 @@ def create_test_files():
             "zip": "10001"
         },
         "hobbies": ["reading", "coding", "hiking"]
-    }
-    with open(os.path.join(test_dir, "valid.json"), "w") as f:
-        json.dump(valid_data, f, indent=2)
-    
+    }, True),
     # JSON with warnings (deep nesting)
-    deep_nested = {
-        "level1": {
-            "level2": {
-                "level3": {
-                    "level4": {
-                        "level5": {
-                            "level6": {
-                                "level7": {
-                                    "level8": {
-                                        "level9": {
-                                            "level10": {
-                                                "level11": {
-                                                    "data": "very deep"
-                                                }
-                                            }
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
-    with open(os.path.join(test_dir, "deep_nested.json"), "w") as f:
-        json.dump(deep_nested, f, indent=2)
-    
+    ("deep_nested.json", _make_nested(11), True),
     # JSON with null values (valid JSON, should not trigger warnings)
-    with_nulls = {
+    ("with_nulls.json", {
         "field1": "value1",
         "field2": None,
         "field3": {
             "nested": None
         }
-    }
-    with open(os.path.join(test_dir, "with_nulls.json"), "w") as f:
-        json.dump(with_nulls, f, indent=2)
-    
-    # Invalid JSON (syntax error)
-    with open(os.path.join(test_dir, "invalid_syntax.json"), "w") as f:
-        f.write('{\n  "name": "John",\n  "age": 30,\n}')  # Trailing comma
-    
-    # Empty JSON file
-    with open(os.path.join(test_dir, "empty.json"), "w") as f:
-        f.write("")
-    
+    }, True),
     # Array with mixed types
-    mixed_array = {
+    ("mixed_array.json", {
         "items": [
             {"type": "A", "value": 1},
             {"type": "B", "value": 2},
             "string_item",  # Different type
             123  # Different type
         ]
-    }
-    with open(os.path.join(test_dir, "mixed_array.json"), "w") as f:
-        json.dump(mixed_array, f, indent=2)
-    
+    }, True),
     # Minified JSON (single line, no indentation - perfectly valid)
-    minified_data = {"name": "John", "age": 30, "city": "New York", "active": True}
-    with open(os.path.join(test_dir, "minified.json"), "w") as f:
-        json.dump(minified_data, f)  # No indent = minified
+    ("minified.json", {"name": "John", "age": 30, "city": "New York", "active": True}, False),
+)
+
+# Fixtures that are not valid JSON, written verbatim: (file name, content)
+_RAW_FIXTURES = (
+    # Invalid JSON (syntax error)
+    ("invalid_syntax.json", b'{\n  "name": "John",\n  "age": 30,\n}'),  # Trailing comma
+    # Empty JSON file
+    ("empty.json", b""),
+)
+
+
+def create_test_files():
+    """Create test JSON files for validation"""
+    test_dir = TEST_DIR
+    if not os.path.exists(test_dir):
+        os.makedirs(test_dir)
+    
+    # Fixtures left over from an earlier run are only rewritten if their content differs
+    for name, payload, indent in _FIXTURES:
+        _write_fixture(os.path.join(test_dir, name), _dumps(payload, indent))
+    
+    for name, content in _RAW_FIXTURES:
+        _write_fixture(os.path.join(test_dir, name), content)
     
     return test_dir
 
 
+@lru_cache(maxsize=1)
+def _discover_test_files(test_dir: str = TEST_DIR) -> tuple:
+    """
+    List the .json fixtures in test_dir as (path, file name) pairs
+    
+    The name comes from the directory entry, so callers need no basename call. Memoized,
+    so the result is an immutable tuple.
+    """
+    return tuple(
+        (entry.path, entry.name)
+        for entry in os.scandir(test_dir)
+        if entry.name.endswith(".json") and entry.is_file()
+    )
+
+
 def test_single_file_validation():
     """Test validating a single file"""
-    print("\n" + "="*80)
-    print("TEST 1: Single File Validation")
-    print("="*80)
+    out = []
+    out.append("\n" + "="*80)
+    out.append("TEST 1: Single File Validation")
+    out.append("="*80)
     
     validator = JSONValidator()
     
     # Test valid file
     result = validator.validate_file("test_json_files/valid.json")
-    print(f"\nFile: valid.json")
-    print(f"Valid: {result['valid']}")
-    print(f"Errors: {result['errors']}")
-    print(f"Warnings: {result['warnings']}")
-    print(f"Info: {result['info']}")
+    out.append(f"\nFile: valid.json")
+    out.append(f"Valid: {result['valid']}")
+    out.append(f"Errors: {result['errors']}")
+    out.append(f"Warnings: {result['warnings']}")
+    out.append(f"Info: {result['info']}")
     
     # Test invalid file
     result = validator.validate_file("test_json_files/invalid_syntax.json")
-    print(f"\nFile: invalid_syntax.json")
-    print(f"Valid: {result['valid']}")
-    print(f"Errors: {result['errors']}")
+    out.append(f"\nFile: invalid_syntax.json")
+    out.append(f"Valid: {result['valid']}")
+    out.append(f"Errors: {result['errors']}")
     if result.get('info', {}).get('suggestions'):
-        print(f"Suggestions: {result['info']['suggestions']}")
+        out.append(f"Suggestions: {result['info']['suggestions']}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def test_batch_validation():
-    """Test validating multiple files"""
-    print("\n" + "="*80)
-    print("TEST 2: Batch Validation")
-    print("="*80)
+def run_batch_validation(results, file_names):
+    """
+    Test validating multiple files
     
-    validator = JSONValidator()
-    
-    # Get all test files
-    test_files = [
-        os.path.join("test_json_files", f)
-        for f in os.listdir("test_json_files")
-        if f.endswith(".json")
-    ]
+    Args:
+        results: validate_batch output for all test files
+        file_names: Dictionary mapping each test file path to its file name
+    """
+    out = []
+    out.append("\n" + "="*80)
+    out.append("TEST 2: Batch Validation")
+    out.append("="*80)
     
-    # Validate all files
-    results = validator.validate_batch(test_files)
-    
-    print(f"\nTotal Files: {results['total_files']}")
-    print(f"Valid Files: {results['valid_files']}")
-    print(f"Invalid Files: {results['invalid_files']}")
-    print(f"Files with Warnings: {results['files_with_warnings']}")
+    out.append(f"\nTotal Files: {results['total_files']}")
+    out.append(f"Valid Files: {results['valid_files']}")
+    out.append(f"Invalid Files: {results['invalid_files']}")
+    out.append(f"Files with Warnings: {results['files_with_warnings']}")
     
     # Show details for each file
-    print("\nDetailed Results:")
+    out.append("\nDetailed Results:")
     for detail in results['details']:
-        filename = os.path.basename(detail['file'])
+        filename = file_names[detail['file']]
         status = "[VALID]" if detail['valid'] else "[INVALID]"
-        print(f"\n  {filename}: {status}")
+        out.append(f"\n  {filename}: {status}")
         
         if detail['errors']:
-            print(f"    Errors: {len(detail['errors'])}")
-            for error in detail['errors'][:2]:  # Show first 2 errors
-                print(f"      - {error}")
+            out.append(f"    Errors: {len(detail['errors'])}")
+            for error in islice(detail['errors'], 2):  # Show first 2 errors
+                out.append(f"      - {error}")
         
         if detail['warnings']:
-            print(f"    Warnings: {len(detail['warnings'])}")
-            for warning in detail['warnings'][:2]:  # Show first 2 warnings
-                print(f"      - {warning}")
+            out.append(f"    Warnings: {len(detail['warnings'])}")
+            for warning in islice(detail['warnings'], 2):  # Show first 2 warnings
+                out.append(f"      - {warning}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def test_report_generation():
-    """Test generating a validation report"""
-    print("\n" + "="*80)
-    print("TEST 3: Report Generation")
-    print("="*80)
-    
-    validator = JSONValidator()
+def run_report_generation(results, validator):
+    """Test generating a validation report from the shared batch results"""
+    out = []
+    out.append("\n" + "="*80)
+    out.append("TEST 3: Report Generation")
+    out.append("="*80)
     
-    # Get all test files
-    test_files = [
-        os.path.join("test_json_files", f)
-        for f in os.listdir("test_json_files")
-        if f.endswith(".json")
-    ]
-    
-    # Validate and generate report
-    results = validator.validate_batch(test_files)
-    report_path = "test_validation_report.txt"
+    # Generate report
+    report_path = REPORT_PATH
     report = validator.generate_report(results, report_path)
     
-    print(f"\nReport generated: {report_path}")
-    print("\nReport Preview:")
-    print("-" * 80)
-    # Show first 40 lines of report
-    lines = report.split('\n')
-    for line in lines[:40]:
-        print(line)
-    if len(lines) > 40:
-        print(f"\n... ({len(lines) - 40} more lines)")
+    out.append(f"\nReport generated: {report_path}")
+    out.append("\nReport Preview:")
+    out.append("-" * 80)
+    # Show first 40 lines of report, without splitting the rest of it into lines
+    for line in islice(io.StringIO(report), 40):
+        out.append(line.rstrip('\n'))
+    total_lines = report.count('\n') + 1
+    if total_lines > 40:
+        out.append(f"\n... ({total_lines - 40} more lines)")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_schema_validation():
     """Test schema validation (if jsonschema is available)"""
-    print("\n" + "="*80)
-    print("TEST 4: Schema Validation")
-    print("="*80)
+    out = []
+    out.append("\n" + "="*80)
+    out.append("TEST 4: Schema Validation")
+    out.append("="*80)
     
     validator = JSONValidator()
     
@@ -213,34 +252,35 @@ def test_schema_validation():
         }
     }
     
+    # Check the schema and build its validator once; it can then be reused for any number of files
+    schema_validator = compile_schema(schema)
+    
     # Test with schema
-    result = validator.validate_file("test_json_files/valid.json", schema)
+    result = validator.validate_file("test_json_files/valid.json", schema, schema_validator=schema_validator)
     
-    print(f"\nFile: valid.json")
-    print(f"Schema Validation: {result['valid']}")
+    out.append(f"\nFile: valid.json")
+    out.append(f"Schema Validation: {result['valid']}")
     if 'schema_validation' in result.get('info', {}):
-        print(f"Schema Details: {result['info']['schema_validation']}")
+        out.append(f"Schema Details: {result['info']['schema_validation']}")
     else:
-        print("Note: Install jsonschema library for advanced schema validation")
+        out.append("Note: Install jsonschema library for advanced schema validation")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cleanup_test_files():
     """Clean up test files"""
-    import shutil
-    if os.path.exists("test_json_files"):
-        shutil.rmtree("test_json_files")
-    if os.path.exists("test_validation_report.txt"):
-        os.remove("test_validation_report.txt")
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
     print("\nTest files cleaned up.")
 
 
 def main():
     """Run all tests"""
     # Set UTF-8 encoding for Windows console
-    import sys
     if sys.platform == 'win32':
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        # Switch the existing streams in place rather than wrapping stdout in a new TextIOWrapper
+        sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
+        sys.stderr.reconfigure(encoding='utf-8')
     
     print("\n" + "="*80)
     print("JSON VALIDATOR TEST SUITE")
@@ -252,10 +292,15 @@ def main():
         test_dir = create_test_files()
         print(f"Test files created in: {test_dir}")
         
+        # Validate all test files once; the batch and report tests share the results
+        validator = JSONValidator()
+        file_names = dict(_discover_test_files())
+        batch_results = validator.validate_batch(list(file_names))
+        
         # Run tests
         test_single_file_validation()
-        test_batch_validation()
-        test_report_generation()
+        run_batch_validation(batch_results, file_names)
+        run_report_generation(batch_results, validator)
         test_schema_validation()
         
         print("\n" + "="*80)
@@ -269,11 +314,11 @@ def main():
                 cleanup_test_files()
             else:
                 print(f"\nTest files kept in: {test_dir}")
-                print("Test report: test_validation_report.txt")
+                print(f"Test report: {REPORT_PATH}")
         except (EOFError, KeyboardInterrupt):
             print(f"\n\nTest files kept in: {test_dir}")
-            print("Test report: test_validation_report.txt")
-            print("\nTo clean up manually, delete the 'test_json_files' folder and 'test_validation_report.txt'")
+            print(f"Test report: {REPORT_PATH}")
+            print(f"\nTo clean up manually, delete the '{TEST_DIR}' folder")
     
     except Exception as e:
         print(f"\nTest failed with error: {str(e)}")